@@ -7,9 +7,20 @@ __all__ = ('Json', )
 
 
 class Json:
+    obj: typing.Any
+    _hash: int | None
+
+    __slots__ = ('obj', '_hash')
 
     def __init__(self, obj: typing.Any):
         self.obj = obj
+        self._hash = None
 
     def __hash__(self):
+        # The wrapped object is treated as immutable, so the hash is computed once.
+        if self._hash is None:
+            self._hash = self._compute_hash()
+        return self._hash
+
+    def _compute_hash(self) -> int:
         return hash(freeze(self.obj))
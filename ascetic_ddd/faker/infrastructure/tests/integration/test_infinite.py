@@ -35,7 +35,7 @@ from ascetic_ddd.faker.infrastructure.repositories import (
     CompositeAutoPkRepository as CompositeRepository
 )
 from ascetic_ddd.seedwork.infrastructure.session.composite_session import CompositeSessionPool
-from ascetic_ddd.seedwork.infrastructure.tests.mock_server import get_free_port, start_mock_server
+from ascetic_ddd.seedwork.infrastructure.tests.mock_server import start_mock_server
 
 # logging.basicConfig(level="INFO")
 
@@ -474,8 +474,7 @@ class RestPgIntegrationTestCase(IsolatedAsyncioTestCase):
     make_distributor = staticmethod(pg_distributor_factory)
 
     async def asyncSetUp(self):
-        self.mock_server_port = get_free_port()
-        self.mock_server = start_mock_server(self.mock_server_port, MockServerRequestHandler)
+        self.mock_server, self.mock_server_port = start_mock_server(MockServerRequestHandler)
         self.session_pool = await self._make_session_pool()
 
     async def test_first_model_faker(self):
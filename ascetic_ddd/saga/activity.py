@@ -23,8 +23,13 @@ class Activity(metaclass=ABCMeta):
 
     Activities are executed by ActivityHost and their results
     are tracked in the RoutingSlip.
+
+    Queue addresses are usually constant, so subclasses may declare
+    them as plain class attributes instead of properties.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def do_work(self, work_item: 'WorkItem') -> 'WorkLog':
         """Execute the activity's business logic.
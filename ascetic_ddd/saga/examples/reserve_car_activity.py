@@ -21,6 +21,11 @@ class ReserveCarActivity(Activity):
     as car reservations are usually easy to cancel.
     """
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./carReservations"
+    compensation_queue_address = "sb://./carCancellations"
+
     _rnd = random.Random(2)
 
     def do_work(self, work_item: WorkItem) -> WorkLog:
@@ -48,13 +53,3 @@ class ReserveCarActivity(Activity):
         """
         reservation_id = work_log.result["reservationId"]
         return True
-
-    @property
-    def work_item_queue_address(self) -> str:
-        """Queue address for car reservation requests."""
-        return "sb://./carReservations"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        """Queue address for car cancellation requests."""
-        return "sb://./carCancellations"
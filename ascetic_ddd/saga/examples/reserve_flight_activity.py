@@ -24,6 +24,11 @@ class ReserveFlightActivity(Activity):
     to demonstrate the compensation mechanism.
     """
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./flightReservations"
+    compensation_queue_address = "sb://./flightCancellations"
+
     _rnd = random.Random(3)
 
     def do_work(self, work_item: WorkItem) -> WorkLog:
@@ -55,20 +60,12 @@ class ReserveFlightActivity(Activity):
         reservation_id = work_log.result["reservationId"]
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        """Queue address for flight reservation requests."""
-        return "sb://./flightReservations"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        """Queue address for flight cancellation requests."""
-        return "sb://./flightCancellations"
-
 
 class FailingReserveFlightActivity(ReserveFlightActivity):
     """Flight activity that always fails - for demonstrating compensation."""
 
+    __slots__ = ()
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         """Attempt to reserve a flight (always fails).
 
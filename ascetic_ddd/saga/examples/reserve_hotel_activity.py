@@ -21,6 +21,11 @@ class ReserveHotelActivity(Activity):
     as hotels typically allow cancellation until 24 hours before check-in.
     """
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./hotelReservations"
+    compensation_queue_address = "sb://./hotelCancellations"
+
     _rnd = random.Random(1)
 
     def do_work(self, work_item: WorkItem) -> WorkLog:
@@ -48,13 +53,3 @@ class ReserveHotelActivity(Activity):
         """
         reservation_id = work_log.result["reservationId"]
         return True
-
-    @property
-    def work_item_queue_address(self) -> str:
-        """Queue address for hotel reservation requests."""
-        return "sb://./hotelReservations"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        """Queue address for hotel cancellation requests."""
-        return "sb://./hotelCancellations"
@@ -108,6 +108,22 @@ class ConcreteActivityTestCase(unittest.TestCase):
         activity = CompleteActivity()
         self.assertIsInstance(activity, Activity)
 
+    def test_queue_addresses_as_class_attributes(self):
+        """Queue addresses can be declared as plain class attributes."""
+        class CompleteActivity(Activity):
+            work_item_queue_address = "sb://./complete"
+            compensation_queue_address = "sb://./completeCompensation"
+
+            def do_work(self, work_item: WorkItem) -> WorkLog:
+                return WorkLog(self, WorkResult({"done": True}))
+
+            def compensate(self, work_log: WorkLog, routing_slip: RoutingSlip) -> bool:
+                return True
+
+        activity = CompleteActivity()
+        self.assertEqual(activity.work_item_queue_address, "sb://./complete")
+        self.assertEqual(activity.compensation_queue_address, "sb://./completeCompensation")
+
     def test_do_work_receives_work_item(self):
         """do_work() receives the work item."""
         received_item = None
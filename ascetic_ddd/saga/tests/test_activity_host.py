@@ -11,12 +11,25 @@ from ascetic_ddd.saga.work_log import WorkLog
 from ascetic_ddd.saga.work_result import WorkResult
 
 
+_EMPTY_ARGS = WorkItemArguments()
+
+
 class Activity1(Activity):
     """First test activity."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./activity1"
+    compensation_queue_address = "sb://./activity1Compensation"
+
     call_count = 0
     compensate_count = 0
 
+    @classmethod
+    def reset(cls) -> None:
+        cls.call_count = 0
+        cls.compensate_count = 0
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         Activity1.call_count += 1
         return WorkLog(self, WorkResult({"id": Activity1.call_count}))
@@ -25,21 +38,23 @@ class Activity1(Activity):
         Activity1.compensate_count += 1
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./activity1"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./activity1Compensation"
-
 
 class Activity2(Activity):
     """Second test activity."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./activity2"
+    compensation_queue_address = "sb://./activity2Compensation"
+
     call_count = 0
     compensate_count = 0
 
+    @classmethod
+    def reset(cls) -> None:
+        cls.call_count = 0
+        cls.compensate_count = 0
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         Activity2.call_count += 1
         return WorkLog(self, WorkResult({"id": Activity2.call_count}))
@@ -48,50 +63,46 @@ class Activity2(Activity):
         Activity2.compensate_count += 1
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./activity2"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./activity2Compensation"
-
 
 class FailingActivity(Activity):
     """Activity that always fails."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./failing"
+    compensation_queue_address = "sb://./failingCompensation"
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         raise RuntimeError("Intentional failure")
 
     def compensate(self, work_log: WorkLog, routing_slip: RoutingSlip) -> bool:
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./failing"
 
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./failingCompensation"
+_ACTIVITY1_ITEM = WorkItem(Activity1, _EMPTY_ARGS)
+_ACTIVITY2_ITEM = WorkItem(Activity2, _EMPTY_ARGS)
+_FAILING_ITEM = WorkItem(FailingActivity, _EMPTY_ARGS)
 
 
-class ActivityHostAcceptMessageTestCase(unittest.TestCase):
-    """Test cases for ActivityHost.accept_message()."""
+class _HostTestCase(unittest.TestCase):
+    """Base test case collecting messages sent by hosts."""
 
     def setUp(self):
-        Activity1.call_count = 0
-        Activity1.compensate_count = 0
-        Activity2.call_count = 0
-        Activity2.compensate_count = 0
+        Activity1.reset()
+        Activity2.reset()
         self.sent_messages = []
 
     def send(self, uri: str, routing_slip: RoutingSlip):
         self.sent_messages.append((uri, routing_slip))
 
+
+class ActivityHostAcceptMessageTestCase(_HostTestCase):
+    """Test cases for ActivityHost.accept_message()."""
+
     def test_accept_work_item_message(self):
         """Host accepts message for its work queue."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([WorkItem(Activity1, WorkItemArguments())])
+        slip = RoutingSlip([_ACTIVITY1_ITEM])
 
         result = host.accept_message("sb://./activity1", slip)
 
@@ -100,7 +111,7 @@ class ActivityHostAcceptMessageTestCase(unittest.TestCase):
     def test_accept_compensation_message(self):
         """Host accepts message for its compensation queue."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([WorkItem(Activity1, WorkItemArguments())])
+        slip = RoutingSlip([_ACTIVITY1_ITEM])
         slip.process_next()
 
         result = host.accept_message("sb://./activity1Compensation", slip)
@@ -110,7 +121,7 @@ class ActivityHostAcceptMessageTestCase(unittest.TestCase):
     def test_reject_unknown_message(self):
         """Host rejects message for unknown queue."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([WorkItem(Activity1, WorkItemArguments())])
+        slip = RoutingSlip([_ACTIVITY1_ITEM])
 
         result = host.accept_message("sb://./unknown", slip)
 
@@ -119,33 +130,20 @@ class ActivityHostAcceptMessageTestCase(unittest.TestCase):
     def test_reject_other_activity_message(self):
         """Host rejects message for other activity."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([WorkItem(Activity2, WorkItemArguments())])
+        slip = RoutingSlip([_ACTIVITY2_ITEM])
 
         result = host.accept_message("sb://./activity2", slip)
 
         self.assertFalse(result)
 
 
-class ActivityHostForwardMessageTestCase(unittest.TestCase):
+class ActivityHostForwardMessageTestCase(_HostTestCase):
     """Test cases for ActivityHost.process_forward_message()."""
 
-    def setUp(self):
-        Activity1.call_count = 0
-        Activity1.compensate_count = 0
-        Activity2.call_count = 0
-        Activity2.compensate_count = 0
-        self.sent_messages = []
-
-    def send(self, uri: str, routing_slip: RoutingSlip):
-        self.sent_messages.append((uri, routing_slip))
-
     def test_forward_success_continues_forward(self):
         """Successful work sends to next activity."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([
-            WorkItem(Activity1, WorkItemArguments()),
-            WorkItem(Activity2, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_ACTIVITY1_ITEM, _ACTIVITY2_ITEM])
 
         host.process_forward_message(slip)
 
@@ -156,10 +154,7 @@ class ActivityHostForwardMessageTestCase(unittest.TestCase):
     def test_forward_failure_starts_compensation(self):
         """Failed work sends to compensation queue."""
         host = ActivityHost(FailingActivity, self.send)
-        slip = RoutingSlip([
-            WorkItem(Activity1, WorkItemArguments()),
-            WorkItem(FailingActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_ACTIVITY1_ITEM, _FAILING_ITEM])
         slip.process_next()  # Complete Activity1
 
         host.process_forward_message(slip)
@@ -178,26 +173,13 @@ class ActivityHostForwardMessageTestCase(unittest.TestCase):
         self.assertEqual(len(self.sent_messages), 0)
 
 
-class ActivityHostBackwardMessageTestCase(unittest.TestCase):
+class ActivityHostBackwardMessageTestCase(_HostTestCase):
     """Test cases for ActivityHost.process_backward_message()."""
 
-    def setUp(self):
-        Activity1.call_count = 0
-        Activity1.compensate_count = 0
-        Activity2.call_count = 0
-        Activity2.compensate_count = 0
-        self.sent_messages = []
-
-    def send(self, uri: str, routing_slip: RoutingSlip):
-        self.sent_messages.append((uri, routing_slip))
-
     def test_backward_continues_backward(self):
         """Compensation continues to previous activity."""
         host = ActivityHost(Activity2, self.send)
-        slip = RoutingSlip([
-            WorkItem(Activity1, WorkItemArguments()),
-            WorkItem(Activity2, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_ACTIVITY1_ITEM, _ACTIVITY2_ITEM])
         slip.process_next()
         slip.process_next()
 
@@ -210,7 +192,7 @@ class ActivityHostBackwardMessageTestCase(unittest.TestCase):
     def test_backward_not_in_progress_does_nothing(self):
         """Backward on non-started slip does nothing."""
         host = ActivityHost(Activity1, self.send)
-        slip = RoutingSlip([WorkItem(Activity1, WorkItemArguments())])
+        slip = RoutingSlip([_ACTIVITY1_ITEM])
 
         host.process_backward_message(slip)
 
@@ -221,10 +203,8 @@ class ActivityHostFullSagaTestCase(unittest.TestCase):
     """Integration tests for full saga with multiple hosts."""
 
     def setUp(self):
-        Activity1.call_count = 0
-        Activity1.compensate_count = 0
-        Activity2.call_count = 0
-        Activity2.compensate_count = 0
+        Activity1.reset()
+        Activity2.reset()
 
     def test_distributed_saga_success(self):
         """Saga completes through multiple hosts."""
@@ -237,20 +217,19 @@ class ActivityHostFullSagaTestCase(unittest.TestCase):
         host2 = ActivityHost(Activity2, send)
         hosts = [host1, host2]
 
-        slip = RoutingSlip([
-            WorkItem(Activity1, WorkItemArguments()),
-            WorkItem(Activity2, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_ACTIVITY1_ITEM, _ACTIVITY2_ITEM])
 
         # Start saga
         send(slip.progress_uri, slip)
 
         # Process all messages
         while messages:
-            uri, routing_slip = messages.pop(0)
-            for host in hosts:
-                if host.accept_message(uri, routing_slip):
-                    break
+            batch = messages[:]
+            messages.clear()
+            for uri, routing_slip in batch:
+                for host in hosts:
+                    if host.accept_message(uri, routing_slip):
+                        break
 
         self.assertTrue(slip.is_completed)
         self.assertEqual(Activity1.call_count, 1)
@@ -268,21 +247,19 @@ class ActivityHostFullSagaTestCase(unittest.TestCase):
         host_fail = ActivityHost(FailingActivity, send)
         hosts = [host1, host2, host_fail]
 
-        slip = RoutingSlip([
-            WorkItem(Activity1, WorkItemArguments()),
-            WorkItem(Activity2, WorkItemArguments()),
-            WorkItem(FailingActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_ACTIVITY1_ITEM, _ACTIVITY2_ITEM, _FAILING_ITEM])
 
         # Start saga
         send(slip.progress_uri, slip)
 
         # Process all messages
         while messages:
-            uri, routing_slip = messages.pop(0)
-            for host in hosts:
-                if host.accept_message(uri, routing_slip):
-                    break
+            batch = messages[:]
+            messages.clear()
+            for uri, routing_slip in batch:
+                for host in hosts:
+                    if host.accept_message(uri, routing_slip):
+                        break
 
         self.assertFalse(slip.is_in_progress)
         self.assertEqual(Activity1.call_count, 1)
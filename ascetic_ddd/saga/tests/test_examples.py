@@ -13,118 +13,64 @@ from ascetic_ddd.saga.work_item import WorkItem
 from ascetic_ddd.saga.work_item_arguments import WorkItemArguments
 
 
-class ReserveCarActivityTestCase(unittest.TestCase):
-    """Test cases for ReserveCarActivity."""
-
-    def test_do_work_creates_reservation(self):
-        """do_work() creates a reservation with ID."""
-        activity = ReserveCarActivity()
-        work_item = WorkItem(
-            ReserveCarActivity,
-            WorkItemArguments({"vehicleType": "Compact"})
-        )
-
-        result = activity.do_work(work_item)
-
-        self.assertIn("reservationId", result.result)
-        self.assertIsInstance(result.result["reservationId"], int)
-
-    def test_compensate_returns_true(self):
-        """compensate() returns True to continue backward."""
-        activity = ReserveCarActivity()
-        work_item = WorkItem(
-            ReserveCarActivity,
-            WorkItemArguments({"vehicleType": "SUV"})
-        )
-        work_log = activity.do_work(work_item)
-        routing_slip = RoutingSlip()
-
-        result = activity.compensate(work_log, routing_slip)
-
-        self.assertTrue(result)
-
-    def test_queue_addresses(self):
-        """Activity has correct queue addresses."""
-        activity = ReserveCarActivity()
-
-        self.assertEqual(activity.work_item_queue_address, "sb://./carReservations")
-        self.assertEqual(activity.compensation_queue_address, "sb://./carCancellations")
-
-
-class ReserveHotelActivityTestCase(unittest.TestCase):
-    """Test cases for ReserveHotelActivity."""
-
-    def test_do_work_creates_reservation(self):
-        """do_work() creates a reservation with ID."""
-        activity = ReserveHotelActivity()
-        work_item = WorkItem(
-            ReserveHotelActivity,
-            WorkItemArguments({"roomType": "Suite"})
-        )
-
-        result = activity.do_work(work_item)
-
-        self.assertIn("reservationId", result.result)
-        self.assertIsInstance(result.result["reservationId"], int)
-
-    def test_compensate_returns_true(self):
-        """compensate() returns True to continue backward."""
-        activity = ReserveHotelActivity()
-        work_item = WorkItem(
-            ReserveHotelActivity,
-            WorkItemArguments({"roomType": "Standard"})
-        )
-        work_log = activity.do_work(work_item)
-        routing_slip = RoutingSlip()
-
-        result = activity.compensate(work_log, routing_slip)
-
-        self.assertTrue(result)
-
-    def test_queue_addresses(self):
-        """Activity has correct queue addresses."""
-        activity = ReserveHotelActivity()
-
-        self.assertEqual(activity.work_item_queue_address, "sb://./hotelReservations")
-        self.assertEqual(activity.compensation_queue_address, "sb://./hotelCancellations")
+_RESERVE_ACTIVITY_CASES = (
+    (
+        ReserveCarActivity,
+        {"vehicleType": "Compact"},
+        "sb://./carReservations",
+        "sb://./carCancellations",
+    ),
+    (
+        ReserveHotelActivity,
+        {"roomType": "Suite"},
+        "sb://./hotelReservations",
+        "sb://./hotelCancellations",
+    ),
+    (
+        ReserveFlightActivity,
+        {"destination": "DUS"},
+        "sb://./flightReservations",
+        "sb://./flightCancellations",
+    ),
+)
 
 
-class ReserveFlightActivityTestCase(unittest.TestCase):
-    """Test cases for ReserveFlightActivity."""
+class ReserveActivityTestCase(unittest.TestCase):
+    """Test cases for ReserveCarActivity, ReserveHotelActivity and ReserveFlightActivity."""
 
     def test_do_work_creates_reservation(self):
         """do_work() creates a reservation with ID."""
-        activity = ReserveFlightActivity()
-        work_item = WorkItem(
-            ReserveFlightActivity,
-            WorkItemArguments({"destination": "DUS"})
-        )
+        for activity_type, arguments, _, _ in _RESERVE_ACTIVITY_CASES:
+            with self.subTest(activity_type=activity_type.__name__):
+                activity = activity_type()
+                work_item = WorkItem(activity_type, WorkItemArguments(arguments))
 
-        result = activity.do_work(work_item)
+                result = activity.do_work(work_item)
 
-        self.assertIn("reservationId", result.result)
-        self.assertIsInstance(result.result["reservationId"], int)
+                self.assertIn("reservationId", result.result)
+                self.assertIsInstance(result.result["reservationId"], int)
 
     def test_compensate_returns_true(self):
         """compensate() returns True to continue backward."""
-        activity = ReserveFlightActivity()
-        work_item = WorkItem(
-            ReserveFlightActivity,
-            WorkItemArguments({"destination": "FRA"})
-        )
-        work_log = activity.do_work(work_item)
-        routing_slip = RoutingSlip()
+        for activity_type, arguments, _, _ in _RESERVE_ACTIVITY_CASES:
+            with self.subTest(activity_type=activity_type.__name__):
+                activity = activity_type()
+                work_item = WorkItem(activity_type, WorkItemArguments(arguments))
+                work_log = activity.do_work(work_item)
+                routing_slip = RoutingSlip()
 
-        result = activity.compensate(work_log, routing_slip)
+                result = activity.compensate(work_log, routing_slip)
 
-        self.assertTrue(result)
+                self.assertTrue(result)
 
     def test_queue_addresses(self):
         """Activity has correct queue addresses."""
-        activity = ReserveFlightActivity()
+        for activity_type, _, work_uri, compensation_uri in _RESERVE_ACTIVITY_CASES:
+            with self.subTest(activity_type=activity_type.__name__):
+                activity = activity_type()
 
-        self.assertEqual(activity.work_item_queue_address, "sb://./flightReservations")
-        self.assertEqual(activity.compensation_queue_address, "sb://./flightCancellations")
+                self.assertEqual(activity.work_item_queue_address, work_uri)
+                self.assertEqual(activity.compensation_queue_address, compensation_uri)
 
 
 class FailingReserveFlightActivityTestCase(unittest.TestCase):
@@ -160,8 +106,9 @@ class TravelBookingSagaTestCase(unittest.TestCase):
             WorkItem(ReserveFlightActivity, WorkItemArguments({"destination": "DUS"})),
         ])
 
-        while not slip.is_completed:
-            result = slip.process_next()
+        process_next = slip.process_next
+        for _ in range(len(slip.pending_work_items)):
+            result = process_next()
             self.assertTrue(result)
 
         self.assertTrue(slip.is_completed)
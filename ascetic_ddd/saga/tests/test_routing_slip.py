@@ -10,12 +10,25 @@ from ascetic_ddd.saga.work_log import WorkLog
 from ascetic_ddd.saga.work_result import WorkResult
 
 
+_EMPTY_ARGS = WorkItemArguments()
+
+
 class SuccessActivity(Activity):
     """Activity that always succeeds."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./success"
+    compensation_queue_address = "sb://./successCompensation"
+
     call_count = 0
     compensate_count = 0
 
+    @classmethod
+    def reset(cls) -> None:
+        cls.call_count = 0
+        cls.compensate_count = 0
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         SuccessActivity.call_count += 1
         return WorkLog(self, WorkResult({"id": SuccessActivity.call_count}))
@@ -24,31 +37,24 @@ class SuccessActivity(Activity):
         SuccessActivity.compensate_count += 1
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./success"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./successCompensation"
-
 
 class FailingActivity(Activity):
     """Activity that always fails."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./failing"
+    compensation_queue_address = "sb://./failingCompensation"
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         raise RuntimeError("Intentional failure")
 
     def compensate(self, work_log: WorkLog, routing_slip: RoutingSlip) -> bool:
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./failing"
 
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./failingCompensation"
+_SUCCESS_ITEM = WorkItem(SuccessActivity, _EMPTY_ARGS)
+_FAILING_ITEM = WorkItem(FailingActivity, _EMPTY_ARGS)
 
 
 class RoutingSlipCreationTestCase(unittest.TestCase):
@@ -76,14 +82,11 @@ class RoutingSlipProcessNextTestCase(unittest.TestCase):
     """Test cases for RoutingSlip.process_next()."""
 
     def setUp(self):
-        SuccessActivity.call_count = 0
-        SuccessActivity.compensate_count = 0
+        SuccessActivity.reset()
 
     def test_process_next_success(self):
         """process_next() returns True on success."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
 
         result = slip.process_next()
 
@@ -93,9 +96,7 @@ class RoutingSlipProcessNextTestCase(unittest.TestCase):
 
     def test_process_next_failure(self):
         """process_next() returns False on failure."""
-        slip = RoutingSlip([
-            WorkItem(FailingActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_FAILING_ITEM])
 
         result = slip.process_next()
 
@@ -112,11 +113,7 @@ class RoutingSlipProcessNextTestCase(unittest.TestCase):
 
     def test_process_multiple_items(self):
         """process_next() processes items in order."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM, _SUCCESS_ITEM, _SUCCESS_ITEM])
 
         slip.process_next()
         self.assertFalse(slip.is_completed)
@@ -135,14 +132,11 @@ class RoutingSlipUndoLastTestCase(unittest.TestCase):
     """Test cases for RoutingSlip.undo_last()."""
 
     def setUp(self):
-        SuccessActivity.call_count = 0
-        SuccessActivity.compensate_count = 0
+        SuccessActivity.reset()
 
     def test_undo_last_success(self):
         """undo_last() compensates last completed work."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
         slip.process_next()
 
         result = slip.undo_last()
@@ -153,20 +147,14 @@ class RoutingSlipUndoLastTestCase(unittest.TestCase):
 
     def test_undo_last_on_empty_raises_error(self):
         """undo_last() on non-started slip raises error."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
 
         with self.assertRaises(InvalidOperationError):
             slip.undo_last()
 
     def test_undo_multiple_items(self):
         """undo_last() compensates in reverse order."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM, _SUCCESS_ITEM, _SUCCESS_ITEM])
         slip.process_next()
         slip.process_next()
         slip.process_next()
@@ -189,9 +177,7 @@ class RoutingSlipUriTestCase(unittest.TestCase):
 
     def test_progress_uri_returns_next_activity_queue(self):
         """progress_uri returns next activity's work queue."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
 
         self.assertEqual(slip.progress_uri, "sb://./success")
 
@@ -203,18 +189,14 @@ class RoutingSlipUriTestCase(unittest.TestCase):
 
     def test_compensation_uri_returns_last_activity_queue(self):
         """compensation_uri returns last completed activity's compensation queue."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
         slip.process_next()
 
         self.assertEqual(slip.compensation_uri, "sb://./successCompensation")
 
     def test_compensation_uri_returns_none_when_not_started(self):
         """compensation_uri returns None when no work completed."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM])
 
         self.assertIsNone(slip.compensation_uri)
 
@@ -223,19 +205,15 @@ class RoutingSlipFullSagaTestCase(unittest.TestCase):
     """Integration tests for full saga execution."""
 
     def setUp(self):
-        SuccessActivity.call_count = 0
-        SuccessActivity.compensate_count = 0
+        SuccessActivity.reset()
 
     def test_successful_saga(self):
         """Full saga completes successfully."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM, _SUCCESS_ITEM, _SUCCESS_ITEM])
 
-        while not slip.is_completed:
-            slip.process_next()
+        process_next = slip.process_next
+        for _ in range(len(slip.pending_work_items)):
+            process_next()
 
         self.assertTrue(slip.is_completed)
         self.assertTrue(slip.is_in_progress)
@@ -243,11 +221,7 @@ class RoutingSlipFullSagaTestCase(unittest.TestCase):
 
     def test_failed_saga_with_compensation(self):
         """Failed saga triggers compensation."""
-        slip = RoutingSlip([
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(SuccessActivity, WorkItemArguments()),
-            WorkItem(FailingActivity, WorkItemArguments()),
-        ])
+        slip = RoutingSlip([_SUCCESS_ITEM, _SUCCESS_ITEM, _FAILING_ITEM])
 
         # Process until failure
         while not slip.is_completed:
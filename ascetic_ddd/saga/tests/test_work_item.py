@@ -10,23 +10,23 @@ from ascetic_ddd.saga.work_log import WorkLog
 from ascetic_ddd.saga.work_result import WorkResult
 
 
+_EMPTY_ARGS = WorkItemArguments()
+
+
 class StubActivity(Activity):
     """Stub activity for testing."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./stub"
+    compensation_queue_address = "sb://./stubCompensation"
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         return WorkLog(self, WorkResult({"id": 123}))
 
     def compensate(self, work_log: WorkLog, routing_slip: RoutingSlip) -> bool:
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./stub"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./stubCompensation"
-
 
 class WorkItemTestCase(unittest.TestCase):
     """Test cases for WorkItem."""
@@ -41,14 +41,14 @@ class WorkItemTestCase(unittest.TestCase):
 
     def test_routing_slip_initially_none(self):
         """WorkItem routing_slip is None initially."""
-        args = WorkItemArguments()
+        args = _EMPTY_ARGS
         work_item = WorkItem(StubActivity, args)
 
         self.assertIsNone(work_item.routing_slip)
 
     def test_routing_slip_can_be_set(self):
         """WorkItem routing_slip can be assigned."""
-        args = WorkItemArguments()
+        args = _EMPTY_ARGS
         work_item = WorkItem(StubActivity, args)
         routing_slip = RoutingSlip()
 
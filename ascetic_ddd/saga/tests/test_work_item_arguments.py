@@ -24,6 +24,11 @@ class WorkItemArgumentsTestCase(unittest.TestCase):
         args = WorkItemArguments()
         self.assertIsInstance(args, dict)
 
+    def test_has_no_instance_dict(self):
+        """WorkItemArguments carries no per-instance __dict__."""
+        args = WorkItemArguments()
+        self.assertFalse(hasattr(args, "__dict__"))
+
     def test_set_and_get_items(self):
         """WorkItemArguments supports dict operations."""
         args = WorkItemArguments()
@@ -1,5 +1,6 @@
 """Tests for WorkLog class."""
 
+import dataclasses
 import unittest
 
 from ascetic_ddd.saga.activity import Activity
@@ -12,20 +13,17 @@ from ascetic_ddd.saga.work_result import WorkResult
 class StubActivity(Activity):
     """Stub activity for testing."""
 
+    __slots__ = ()
+
+    work_item_queue_address = "sb://./stub"
+    compensation_queue_address = "sb://./stubCompensation"
+
     def do_work(self, work_item: WorkItem) -> WorkLog:
         return WorkLog(self, WorkResult({"id": 123}))
 
     def compensate(self, work_log: WorkLog, routing_slip: RoutingSlip) -> bool:
         return True
 
-    @property
-    def work_item_queue_address(self) -> str:
-        return "sb://./stub"
-
-    @property
-    def compensation_queue_address(self) -> str:
-        return "sb://./stubCompensation"
-
 
 class WorkLogTestCase(unittest.TestCase):
     """Test cases for WorkLog."""
@@ -59,6 +57,13 @@ class WorkLogTestCase(unittest.TestCase):
         self.assertEqual(work_log.activity_type, type(activity2))
         self.assertIs(work_log.activity_type, StubActivity)
 
+    def test_is_immutable(self):
+        """WorkLog fields cannot be reassigned."""
+        work_log = WorkLog(StubActivity(), WorkResult())
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            work_log.result = WorkResult()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -24,6 +24,11 @@ class WorkResultTestCase(unittest.TestCase):
         result = WorkResult()
         self.assertIsInstance(result, dict)
 
+    def test_has_no_instance_dict(self):
+        """WorkResult carries no per-instance __dict__."""
+        result = WorkResult()
+        self.assertFalse(hasattr(result, "__dict__"))
+
     def test_set_and_get_items(self):
         """WorkResult supports dict operations."""
         result = WorkResult()
@@ -39,6 +44,13 @@ class WorkResultTestCase(unittest.TestCase):
         self.assertEqual(result["b"], 2)
         self.assertEqual(result["c"], 3)
 
+    def test_merge(self):
+        """WorkResult.merge() merges another mapping in place."""
+        result = WorkResult({"a": 1, "b": 1})
+        result.merge({"b": 2, "c": 3})
+        self.assertEqual(result, {"a": 1, "b": 2, "c": 3})
+        self.assertIsInstance(result, WorkResult)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,4 +15,5 @@ class WorkItemArguments(dict[str, Any]):
     by an activity to perform its work, such as vehicle type,
     room type, destination, etc.
     """
-    pass
+
+    __slots__ = ()
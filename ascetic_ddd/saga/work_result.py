@@ -1,5 +1,6 @@
 """Work result - dictionary of results from activity execution."""
 
+from collections.abc import Mapping
 from typing import Any
 
 
@@ -14,4 +15,13 @@ class WorkResult(dict[str, Any]):
     Stores key-value pairs representing the outcome of DoWork(),
     such as reservation IDs, confirmation numbers, etc.
     """
-    pass
+
+    __slots__ = ()
+
+    def merge(self, other: Mapping[str, Any]) -> None:
+        """Merge another mapping into this result in place.
+
+        Args:
+            other: Mapping whose items override existing keys.
+        """
+        self |= other
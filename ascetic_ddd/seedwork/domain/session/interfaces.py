@@ -13,7 +13,7 @@ class ISession(IObservable, typing.Protocol, metaclass=ABCMeta):
     response_time: float
 
     @abstractmethod
-    async def atomic(self) -> typing.AsyncContextManager["ISession"]:
+    def atomic(self) -> typing.AsyncContextManager["ISession"]:
         raise NotImplementedError
 
 
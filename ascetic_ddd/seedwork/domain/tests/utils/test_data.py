@@ -0,0 +1,100 @@
+import unittest
+
+from ascetic_ddd.seedwork.domain.utils.data import freeze, hashable
+
+
+class HashableTestCase(unittest.TestCase):
+
+    def test_scalar_is_returned_as_is(self):
+        for value in [1, 'a', None, 1.5, (1, 2)]:
+            with self.subTest(value=value):
+                self.assertIs(hashable(value), value)
+
+    def test_dict_keys_are_sorted(self):
+        self.assertEqual(hashable({'b': 2, 'a': 1}), (('a', 1), ('b', 2)))
+
+    def test_list_values_are_sorted(self):
+        self.assertEqual(hashable([3, 1, 2]), (1, 2, 3))
+
+    def test_nested(self):
+        self.assertEqual(
+            hashable({'b': {'d': [2, 1], 'c': {}}, 'a': []}),
+            (('a', ()), ('b', (('c', ()), ('d', (1, 2))))),
+        )
+
+    def test_dict_subclass(self):
+        class Arguments(dict):
+            pass
+
+        self.assertEqual(hashable(Arguments(b=[2, 1], a=1)), (('a', 1), ('b', (1, 2))))
+
+    def test_dict_subclass_with_getitem(self):
+        class Wrapping(dict):
+            def __getitem__(self, key):
+                return [super().__getitem__(key)]
+
+        self.assertEqual(hashable(Wrapping(c=3, a=1, b=2)), (('a', 1), ('b', 2), ('c', 3)))
+
+    def test_equal_objects_have_equal_hashes(self):
+        self.assertEqual(
+            hash(hashable({'a': [1, 2], 'b': {'c': 3, 'd': 4}})),
+            hash(hashable({'b': {'d': 4, 'c': 3}, 'a': [2, 1]})),
+        )
+
+    def test_shared_sub_object(self):
+        shared = {'b': [2, 1]}
+
+        result = hashable({'x': shared, 'y': {'z': shared}})
+
+        self.assertEqual(result, (('x', (('b', (1, 2)),)), ('y', (('z', (('b', (1, 2)),)),))))
+        self.assertIs(result[0][1], result[1][1][0][1])
+
+    def test_circular_reference(self):
+        obj = {}
+        obj['self'] = obj
+
+        with self.assertRaises(ValueError):
+            hashable(obj)
+
+    def test_deep_nesting(self):
+        obj = leaf = {}
+        for _ in range(5000):
+            leaf['a'] = {}
+            leaf = leaf['a']
+
+        result = hashable(obj)
+
+        for _ in range(5000):
+            ((key, result),) = result
+            self.assertEqual(key, 'a')
+        self.assertEqual(result, ())
+
+
+class FreezeTestCase(unittest.TestCase):
+
+    def test_scalar_is_returned_as_is(self):
+        for value in [1, 'a', None]:
+            with self.subTest(value=value):
+                self.assertIs(freeze(value), value)
+
+    def test_dict(self):
+        self.assertEqual(freeze({'b': 2, 'a': 1}), frozenset({('a', 1), ('b', 2)}))
+
+    def test_nested(self):
+        self.assertEqual(
+            freeze({'a': [2, 1], 'b': {'c': 3}}),
+            frozenset({('a', frozenset({1, 2})), ('b', frozenset({('c', 3)}))}),
+        )
+
+    def test_dict_subclass(self):
+        class Result(dict):
+            pass
+
+        self.assertEqual(freeze(Result(a=[1])), frozenset({('a', frozenset({1}))}))
+
+    def test_mixed_key_types(self):
+        self.assertEqual(freeze({1: 'a', 'b': 2}), frozenset({(1, 'a'), ('b', 2)}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,84 @@
+from operator import itemgetter
 
 __all__ = ("hashable", "freeze", "is_subset",)
 
 
-def hashable(o):
+_DICT = 1
+_LIST = 2
+
+
+# Container kind by exact type, subclasses are recognized with isinstance()
+_container_kinds = {dict: _DICT, list: _LIST}
+
+
+def _container_kind(o):
+    kind = _container_kinds.get(type(o))
+    if kind is not None:
+        return kind
     if isinstance(o, dict):
-        return tuple(sorted((k, hashable(v)) for k, v in o.items()))
+        return _DICT
     if isinstance(o, list):
-        return tuple([hashable(v) for v in sorted(o)])
-    return o
+        return _LIST
+    return None
+
+
+_PENDING = object()
+
+_key_of = itemgetter(0)
+_value_of = itemgetter(1)
+
+
+def _frame(kind, o):
+    if kind is _DICT:
+        items = sorted(o.items(), key=_key_of)
+        return kind, list(map(_key_of, items)), map(_value_of, items), [], id(o)
+    return kind, None, iter(sorted(o)), [], id(o)
+
+
+def hashable(o):
+    """
+    Converts nested dicts and lists into sorted tuples.
+    Walks the structure with an explicit stack, so deep nesting does not hit the recursion limit.
+    A sub-object reachable by several paths is converted only once per call.
+    """
+    kind = _container_kind(o)
+    if kind is None:
+        return o
+    converted_by_id = {id(o): _PENDING}
+    # Every memoized container stays referenced until the call ends, so its id is not reused
+    alive = [o]
+    stack = [_frame(kind, o)]
+    while True:
+        kind, keys, values, converted, key = stack[-1]
+        for v in values:
+            child_kind = _container_kind(v)
+            if child_kind is None:
+                converted.append(v)
+                continue
+            child = converted_by_id.get(id(v))
+            if child is None:
+                converted_by_id[id(v)] = _PENDING
+                alive.append(v)
+                stack.append(_frame(child_kind, v))
+                break
+            if child is _PENDING:
+                raise ValueError("Circular reference detected")
+            converted.append(child)
+        else:
+            stack.pop()
+            result = tuple(zip(keys, converted)) if kind is _DICT else tuple(converted)
+            if not stack:
+                return result
+            converted_by_id[key] = result
+            stack[-1][3].append(result)
 
 
 def freeze(o):
-    if isinstance(o, dict):
-        return frozenset(sorted((k, freeze(v)) for k, v in o.items()))
-    if isinstance(o, list):
-        return frozenset([freeze(v) for v in sorted(o)])
+    kind = _container_kind(o)
+    if kind is _DICT:
+        return frozenset(zip(o.keys(), map(freeze, o.values())))
+    if kind is _LIST:
+        return frozenset(map(freeze, o))
     return o
 
 
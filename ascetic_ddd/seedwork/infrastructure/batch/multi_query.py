@@ -8,7 +8,7 @@ from ascetic_ddd.seedwork.infrastructure.session.interfaces import (
 )
 
 from .interfaces import IMultiQuerier
-from .utils import RE_INSERT_VALUES, convert_named_to_positional
+from .utils import convert_named_to_positional, split_values_clause
 
 
 __all__ = (
@@ -40,13 +40,17 @@ class MultiQueryBase(metaclass=ABCMeta):
     def __init__(self):
         self._sql_template: str = ""
         self._values_pattern: str = ""
+        self._sql_head: str = ""
+        self._sql_tail: str = ""
         self._params: list[typing.Sequence[typing.Any]] = []
         self._results: list[Deferred[Row]] = []
 
     def _build_sql(self) -> str:
         """Build the combined SQL query with duplicated VALUES clauses."""
-        combined_values = ", ".join([self._values_pattern] * len(self._params))
-        return RE_INSERT_VALUES.sub(f"VALUES {combined_values}", self._sql_template)
+        if not self._values_pattern:
+            return self._sql_template
+        values = ", ".join([self._values_pattern] * len(self._params))
+        return self._sql_head + "VALUES " + values + self._sql_tail
 
     def _merge_params(self) -> tuple[typing.Any, ...]:
         """Merge all params sequences into one tuple."""
@@ -82,9 +86,9 @@ class MultiQueryBase(metaclass=ABCMeta):
         # Store template on first call
         if not self._sql_template:
             self._sql_template = query_str
-            match = RE_INSERT_VALUES.search(query_str)
-            if match:
-                self._values_pattern = match.group(1)
+            parts = split_values_clause(query_str)
+            if parts is not None:
+                self._sql_head, self._values_pattern, self._sql_tail = parts
 
         # Store parameters
         if params is None:
@@ -1,4 +1,6 @@
 """Utility functions for batch query operations."""
+import functools
+import operator
 import re
 import typing
 
@@ -7,6 +9,7 @@ __all__ = (
     "is_insert_query",
     "is_autoincrement_insert_query",
     "convert_named_to_positional",
+    "split_values_clause",
     "RE_INSERT_VALUES",
     "RE_NAMED_PARAM",
 )
@@ -20,6 +23,9 @@ RE_INSERT_VALUES = re.compile(r"VALUES\s*(\((?:[^)]|\)s)+\))", re.IGNORECASE)
 # Pattern for matching named parameters %(name)s
 RE_NAMED_PARAM = re.compile(r"%\((\w+)\)s")
 
+_RE_VALUES_KEYWORD = re.compile(r"VALUES\s*\(", re.IGNORECASE)
+_RE_PAREN_OR_QUOTE = re.compile(r"[()']")
+
 
 def convert_named_to_positional(
     query: str,
@@ -40,18 +46,86 @@ def convert_named_to_positional(
         params = {'a': 1, 'b': 'x'}
         result = ("INSERT INTO t (a, b) VALUES (%s, %s)", (1, 'x'))
     """
-    # Extract param names in order of appearance
-    param_names = RE_NAMED_PARAM.findall(query)
+    converted_query, param_names, params_getter = _parse_named_params(query)
 
     # Build positional params tuple
-    positional_params = tuple(params[name] for name in param_names)
-
-    # Convert query: %(name)s -> %s
-    converted_query = RE_NAMED_PARAM.sub("%s", query)
+    if params_getter is not None:
+        positional_params = params_getter(params)
+    else:
+        positional_params = tuple(params[name] for name in param_names)
 
     return converted_query, positional_params
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_named_params(query: str) -> tuple[str, tuple[str, ...], typing.Callable | None]:
+    # The same INSERT template is converted once per row of a batch, so the parse is cached per query.
+    # The result depends on the query text only and is never mutated, so sharing it is safe;
+    # queries are a few templates from the code, so a small bound is enough.
+    param_names: list[str] = []
+
+    def _replace(match: re.Match[str]) -> str:
+        param_names.append(match.group(1))
+        return "%s"
+
+    # Convert query: %(name)s -> %s, collecting param names in order of appearance
+    converted_query = RE_NAMED_PARAM.sub(_replace, query)
+
+    # itemgetter() returns a tuple only for two or more keys
+    params_getter = operator.itemgetter(*param_names) if len(param_names) > 1 else None
+    return converted_query, tuple(param_names), params_getter
+
+
+def split_values_clause(query: str) -> tuple[str, str, str] | None:
+    """
+    Split INSERT query around the row constructor of its VALUES clause.
+
+    Unlike RE_INSERT_VALUES, parentheses are balanced, so function calls
+    and quoted literals inside the row are kept whole, and the scan is linear.
+
+    Args:
+        query: SQL INSERT query
+
+    Returns:
+        Tuple of (head, row, tail), where head is the query before the VALUES keyword
+        and tail is the query after the row, or None if there is no VALUES clause
+
+    Example:
+        query = "INSERT INTO t (a, b) VALUES (%s, now()) RETURNING id"
+        result = ("INSERT INTO t (a, b) ", "(%s, now())", " RETURNING id")
+    """
+    match = _RE_VALUES_KEYWORD.search(query)
+    if match is None:
+        return None
+    row_start = match.end() - 1
+    depth = 0
+    quoted = False
+    for token in _RE_PAREN_OR_QUOTE.finditer(query, row_start):
+        char = token.group()
+        if char == "'":
+            # A doubled quote inside a literal toggles twice, so it needs no special case
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char == "(":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                row_end = token.end()
+                return query[:match.start()], query[row_start:row_end], query[row_end:]
+    return None
+
+
+def _starts_with_insert(query: str) -> bool:
+    # Only the first keyword is upper-cased, so non-INSERT queries are rejected cheaply.
+    return query.lstrip()[:6].upper() == "INSERT"
+
+
+def _has_returning(query: str) -> bool:
+    return "RETURNING" in query.upper()
+
+
 def is_insert_query(query: str) -> bool:
     """
     Check if query is an INSERT without RETURNING clause.
@@ -62,8 +136,7 @@ def is_insert_query(query: str) -> bool:
     Returns:
         True if it's an INSERT without RETURNING
     """
-    trimmed = query.strip().upper()
-    return trimmed.startswith("INSERT") and "RETURNING" not in trimmed
+    return _starts_with_insert(query) and not _has_returning(query)
 
 
 def is_autoincrement_insert_query(query: str) -> bool:
@@ -76,5 +149,4 @@ def is_autoincrement_insert_query(query: str) -> bool:
     Returns:
         True if it's an INSERT with RETURNING
     """
-    trimmed = query.strip().upper()
-    return trimmed.startswith("INSERT") and "RETURNING" in trimmed
+    return _starts_with_insert(query) and _has_returning(query)
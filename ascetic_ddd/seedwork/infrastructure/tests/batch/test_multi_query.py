@@ -112,6 +112,30 @@ class MultiQueryBaseTestCase(TestCase):
             "INSERT INTO t (a) VALUES (%s), (%s) RETURNING id"
         )
 
+    def test_build_sql_with_function_call(self):
+        mq = MultiQuery()
+        query = "INSERT INTO t (a, b) VALUES (%s, now())"
+        mq.execute(query, (1,))
+        mq.execute(query, (2,))
+
+        sql = mq._build_sql()
+        self.assertEqual(
+            sql,
+            "INSERT INTO t (a, b) VALUES (%s, now()), (%s, now())"
+        )
+
+    def test_build_sql_keeps_backslashes(self):
+        mq = MultiQuery()
+        query = "INSERT INTO t (a, b) VALUES (%s, E'\\n')"
+        mq.execute(query, (1,))
+        mq.execute(query, (2,))
+
+        sql = mq._build_sql()
+        self.assertEqual(
+            sql,
+            "INSERT INTO t (a, b) VALUES (%s, E'\\n'), (%s, E'\\n')"
+        )
+
     def test_merge_params_single_row(self):
         mq = MultiQuery()
         mq.execute("INSERT INTO t (a, b) VALUES (%s, %s)", (1, "x"))
@@ -5,6 +5,7 @@ from ...batch.utils import (
     is_insert_query,
     is_autoincrement_insert_query,
     convert_named_to_positional,
+    split_values_clause,
     RE_INSERT_VALUES,
     RE_NAMED_PARAM,
 )
@@ -13,89 +14,59 @@ from ...batch.utils import (
 class IsInsertQueryTestCase(TestCase):
     """Tests for is_insert_query function."""
 
-    def test_simple_insert(self):
-        query = "INSERT INTO users (name) VALUES (%s)"
-        self.assertTrue(is_insert_query(query))
+    CASES = (
+        ("INSERT INTO users (name) VALUES (%s)", True),
+        ("INSERT INTO users (name, email, age) VALUES (%s, %s, %s)", True),
+        ("insert into users (name) values (%s)", True),
+        ("  INSERT INTO users (name) VALUES (%s)  ", True),
+        ("Insert Into users (name) Values (%s)", True),
+        ("INSERT INTO users (name) VALUES (%s) RETURNING id", False),
+        ("SELECT * FROM users", False),
+        ("UPDATE users SET name = %s WHERE id = %s", False),
+        ("DELETE FROM users WHERE id = %s", False),
+    )
 
-    def test_insert_multiple_columns(self):
-        query = "INSERT INTO users (name, email, age) VALUES (%s, %s, %s)"
-        self.assertTrue(is_insert_query(query))
-
-    def test_insert_with_returning_is_false(self):
-        query = "INSERT INTO users (name) VALUES (%s) RETURNING id"
-        self.assertFalse(is_insert_query(query))
-
-    def test_insert_lowercase(self):
-        query = "insert into users (name) values (%s)"
-        self.assertTrue(is_insert_query(query))
-
-    def test_insert_with_whitespace(self):
-        query = "  INSERT INTO users (name) VALUES (%s)  "
-        self.assertTrue(is_insert_query(query))
-
-    def test_select_is_false(self):
-        query = "SELECT * FROM users"
-        self.assertFalse(is_insert_query(query))
-
-    def test_update_is_false(self):
-        query = "UPDATE users SET name = %s WHERE id = %s"
-        self.assertFalse(is_insert_query(query))
-
-    def test_delete_is_false(self):
-        query = "DELETE FROM users WHERE id = %s"
-        self.assertFalse(is_insert_query(query))
+    def test_is_insert_query(self):
+        for query, expected in self.CASES:
+            with self.subTest(query=query):
+                self.assertIs(is_insert_query(query), expected)
 
 
 class IsAutoincrementInsertQueryTestCase(TestCase):
     """Tests for is_autoincrement_insert_query function."""
 
-    def test_insert_with_returning(self):
-        query = "INSERT INTO users (name) VALUES (%s) RETURNING id"
-        self.assertTrue(is_autoincrement_insert_query(query))
-
-    def test_insert_with_returning_multiple_columns(self):
-        query = "INSERT INTO users (name) VALUES (%s) RETURNING id, created_at"
-        self.assertTrue(is_autoincrement_insert_query(query))
+    CASES = (
+        ("INSERT INTO users (name) VALUES (%s) RETURNING id", True),
+        ("INSERT INTO users (name) VALUES (%s) RETURNING id, created_at", True),
+        ("insert into users (name) values (%s) returning id", True),
+        ("INSERT INTO users (name) VALUES (%s)", False),
+        ("SELECT * FROM users", False),
+    )
 
-    def test_insert_without_returning_is_false(self):
-        query = "INSERT INTO users (name) VALUES (%s)"
-        self.assertFalse(is_autoincrement_insert_query(query))
-
-    def test_returning_lowercase(self):
-        query = "insert into users (name) values (%s) returning id"
-        self.assertTrue(is_autoincrement_insert_query(query))
-
-    def test_select_is_false(self):
-        query = "SELECT * FROM users"
-        self.assertFalse(is_autoincrement_insert_query(query))
+    def test_is_autoincrement_insert_query(self):
+        for query, expected in self.CASES:
+            with self.subTest(query=query):
+                self.assertIs(is_autoincrement_insert_query(query), expected)
 
 
 class ReInsertValuesTestCase(TestCase):
     """Tests for RE_INSERT_VALUES regex pattern."""
 
-    def test_match_simple_values(self):
-        query = "INSERT INTO t (a) VALUES (%s)"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%s)")
-
-    def test_match_multiple_placeholders(self):
-        query = "INSERT INTO t (a, b, c) VALUES (%s, %s, %s)"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%s, %s, %s)")
-
-    def test_match_with_returning(self):
-        query = "INSERT INTO t (a, b) VALUES (%s, %s) RETURNING id"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%s, %s)")
-
-    def test_match_lowercase(self):
-        query = "insert into t (a) values (%s)"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%s)")
+    MATCH_CASES = (
+        ("INSERT INTO t (a) VALUES (%s)", "(%s)"),
+        ("INSERT INTO t (a, b, c) VALUES (%s, %s, %s)", "(%s, %s, %s)"),
+        ("INSERT INTO t (a, b) VALUES (%s, %s) RETURNING id", "(%s, %s)"),
+        ("insert into t (a) values (%s)", "(%s)"),
+        ("INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)", "(%(a)s, %(b)s)"),
+        ("INSERT INTO t (a, b) VALUES (%(a)s, %(b)s) RETURNING id", "(%(a)s, %(b)s)"),
+    )
+
+    def test_match(self):
+        for query, expected in self.MATCH_CASES:
+            with self.subTest(query=query):
+                match = RE_INSERT_VALUES.search(query)
+                self.assertIsNotNone(match)
+                self.assertEqual(match.group(1), expected)
 
     def test_no_match_select(self):
         query = "SELECT * FROM users"
@@ -112,36 +83,21 @@ class ReInsertValuesTestCase(TestCase):
             "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s) RETURNING id"
         )
 
-    def test_match_named_params(self):
-        query = "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%(a)s, %(b)s)")
-
-    def test_match_named_params_with_returning(self):
-        query = "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s) RETURNING id"
-        match = RE_INSERT_VALUES.search(query)
-        self.assertIsNotNone(match)
-        self.assertEqual(match.group(1), "(%(a)s, %(b)s)")
-
 
 class ReNamedParamTestCase(TestCase):
     """Tests for RE_NAMED_PARAM regex pattern."""
 
-    def test_findall_single_param(self):
-        query = "INSERT INTO t (a) VALUES (%(a)s)"
-        names = RE_NAMED_PARAM.findall(query)
-        self.assertEqual(names, ["a"])
+    FINDALL_CASES = (
+        ("INSERT INTO t (a) VALUES (%(a)s)", ["a"]),
+        ("INSERT INTO t (a, b, c) VALUES (%(a)s, %(b)s, %(c)s)", ["a", "b", "c"]),
+        # Order of appearance is preserved
+        ("INSERT INTO t (x, y, z) VALUES (%(z)s, %(x)s, %(y)s)", ["z", "x", "y"]),
+    )
 
-    def test_findall_multiple_params(self):
-        query = "INSERT INTO t (a, b, c) VALUES (%(a)s, %(b)s, %(c)s)"
-        names = RE_NAMED_PARAM.findall(query)
-        self.assertEqual(names, ["a", "b", "c"])
-
-    def test_findall_preserves_order(self):
-        query = "INSERT INTO t (x, y, z) VALUES (%(z)s, %(x)s, %(y)s)"
-        names = RE_NAMED_PARAM.findall(query)
-        self.assertEqual(names, ["z", "x", "y"])
+    def test_findall(self):
+        for query, expected in self.FINDALL_CASES:
+            with self.subTest(query=query):
+                self.assertEqual(RE_NAMED_PARAM.findall(query), expected)
 
     def test_sub_converts_to_positional(self):
         query = "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)"
@@ -149,6 +105,41 @@ class ReNamedParamTestCase(TestCase):
         self.assertEqual(result, "INSERT INTO t (a, b) VALUES (%s, %s)")
 
 
+class SplitValuesClauseTestCase(TestCase):
+    """Tests for split_values_clause function."""
+
+    CASES = (
+        ("INSERT INTO t (a) VALUES (%s)", ("INSERT INTO t (a) ", "(%s)", "")),
+        ("insert into t (a) values(%s)", ("insert into t (a) ", "(%s)", "")),
+        (
+            "INSERT INTO t (a, b) VALUES (%s, %s) RETURNING id",
+            ("INSERT INTO t (a, b) ", "(%s, %s)", " RETURNING id"),
+        ),
+        (
+            "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)",
+            ("INSERT INTO t (a, b) ", "(%(a)s, %(b)s)", ""),
+        ),
+        (
+            "INSERT INTO t (a, b) VALUES (%s, now())",
+            ("INSERT INTO t (a, b) ", "(%s, now())", ""),
+        ),
+        (
+            "INSERT INTO t (a, b) VALUES (%s, ')''(') RETURNING id",
+            ("INSERT INTO t (a, b) ", "(%s, ')''(')", " RETURNING id"),
+        ),
+    )
+
+    def test_split(self):
+        for query, expected in self.CASES:
+            with self.subTest(query=query):
+                self.assertEqual(split_values_clause(query), expected)
+
+    def test_no_values_clause(self):
+        for query in ("SELECT * FROM users", "INSERT INTO t (a) VALUES (%s"):
+            with self.subTest(query=query):
+                self.assertIsNone(split_values_clause(query))
+
+
 class ConvertNamedToPositionalTestCase(TestCase):
     """Tests for convert_named_to_positional function."""
 
@@ -209,3 +200,12 @@ class ConvertNamedToPositionalTestCase(TestCase):
 
         self.assertEqual(converted_query, "INSERT INTO t (a, b, c) VALUES (%s, %s, %s)")
         self.assertEqual(positional_params, (1, 1, 2))
+
+    def test_same_query_with_different_params(self):
+        query = "INSERT INTO t (a, b) VALUES (%(a)s, %(b)s)"
+
+        first = convert_named_to_positional(query, {"a": 1, "b": "x"})
+        second = convert_named_to_positional(query, {"b": "y", "a": 2})
+
+        self.assertEqual(first, ("INSERT INTO t (a, b) VALUES (%s, %s)", (1, "x")))
+        self.assertEqual(second, ("INSERT INTO t (a, b) VALUES (%s, %s)", (2, "y")))
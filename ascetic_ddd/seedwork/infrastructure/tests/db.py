@@ -1,14 +1,26 @@
 import os
-from psycopg_pool import AsyncConnectionPool
 
-from ..session import PgSessionPool
+
+async def _configure_connection(conn):
+    # Test queries are small, JIT compilation only adds planning overhead to them.
+    await conn.execute("SET jit = off")
+    await conn.commit()
 
 
 async def make_pg_session_pool():
+    # Imported here, so that collecting tests which never touch PostgreSQL does not load psycopg.
+    from psycopg_pool import AsyncConnectionPool
+    from ..session import PgSessionPool
+
     postgresql_url = os.environ.get(
         'TEST_POSTGRESQL_URL',
         ''
     )
-    pool = AsyncConnectionPool(postgresql_url, open=False)
-    await pool.open()
+    pool = AsyncConnectionPool(
+        postgresql_url,
+        max_size=16,
+        configure=_configure_connection,
+        open=False,
+    )
+    await pool.open(wait=True, timeout=10)
     return PgSessionPool(pool)
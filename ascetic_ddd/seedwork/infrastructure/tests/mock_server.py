@@ -1,21 +1,20 @@
 # Standard library imports...
-import socket
 import typing
 from threading import Thread
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 
-def get_free_port():
-    s = socket.socket(socket.AF_INET, type=socket.SOCK_STREAM)
-    s.bind(('localhost', 0))
-    address, port = s.getsockname()
-    s.close()
-    return port
+class _Server(ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
 
 
-def start_mock_server(port: int, request_handler: typing.Type[BaseHTTPRequestHandler]) -> HTTPServer:
-    mock_server = HTTPServer(('localhost', port), request_handler)
-    mock_server_thread = Thread(target=mock_server.serve_forever)
-    mock_server_thread.setDaemon(True)
+def start_mock_server(
+        request_handler: typing.Type[BaseHTTPRequestHandler]
+) -> tuple[ThreadingHTTPServer, int]:
+    # Port 0 lets the OS pick a free port at bind time, so no other process can grab it in between.
+    mock_server = _Server(('localhost', 0), request_handler)
+    port = mock_server.server_address[1]
+    mock_server_thread = Thread(target=mock_server.serve_forever, daemon=True)
     mock_server_thread.start()
-    return mock_server
+    return mock_server, port
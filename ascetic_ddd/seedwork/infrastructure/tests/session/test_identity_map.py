@@ -1,24 +1,34 @@
-import gc
 from unittest import TestCase
 
 from ...session import IdentityMap
 
 
 class Model:
+    __slots__ = ('id', '__weakref__')
+
     def __init__(self, pk: int):
         self.id = pk
 
 
 class IdentityMapTestCase(TestCase):
+    identity_map: IdentityMap
+
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the tests that use the default map; custom-sized maps are built locally.
+        cls.identity_map = IdentityMap()
+
+    def setUp(self):
+        self.identity_map.clear()
+
     def test_get(self):
-        identity_map = IdentityMap()
         pk = 3
         obj = Model(pk)
-        identity_map.add(pk, obj)
-        result = identity_map.get(pk)
+        self.identity_map.add(pk, obj)
+        result = self.identity_map.get(pk)
         self.assertIs(obj, result)
         with self.assertRaises(KeyError):
-            identity_map.get(10)
+            self.identity_map.get(10)
 
     # noinspection SpellCheckingInspection
     def test_get_weakref_cache(self):
@@ -28,7 +38,6 @@ class IdentityMapTestCase(TestCase):
         obj_id = id(obj)
         identity_map.add(pk, obj)
         del obj
-        gc.collect()
         result = identity_map.get(pk)
         self.assertEqual(obj_id, id(result))
 
@@ -40,32 +49,28 @@ class IdentityMapTestCase(TestCase):
         identity_map.add(pk, obj)
         del obj
         identity_map.add(10, Model(10))
-        gc.collect()
         with self.assertRaises(KeyError):
             identity_map.get(pk)
 
     def test_has(self):
-        identity_map = IdentityMap()
         pk = 3
         obj = Model(pk)
-        identity_map.add(pk, obj)
-        self.assertTrue(identity_map.has(pk))
-        self.assertFalse(identity_map.has(10))
+        self.identity_map.add(pk, obj)
+        self.assertTrue(self.identity_map.has(pk))
+        self.assertFalse(self.identity_map.has(10))
 
     def test_remove(self):
-        identity_map = IdentityMap()
         pk = 3
         obj = Model(pk)
-        identity_map.add(pk, obj)
-        identity_map.remove(pk)
+        self.identity_map.add(pk, obj)
+        self.identity_map.remove(pk)
         with self.assertRaises(KeyError):
-            identity_map.get(pk)
+            self.identity_map.get(pk)
 
     def test_clear(self):
-        identity_map = IdentityMap()
         pk = 3
         obj = Model(pk)
-        identity_map.add(pk, obj)
-        identity_map.clear()
+        self.identity_map.add(pk, obj)
+        self.identity_map.clear()
         with self.assertRaises(KeyError):
-            identity_map.get(pk)
+            self.identity_map.get(pk)
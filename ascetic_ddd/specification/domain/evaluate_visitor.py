@@ -1,7 +1,8 @@
 """Evaluate visitor for executing specification expressions."""
-from typing import Any, Protocol, runtime_checkable
+import functools
+from typing import Any, Iterable, Protocol, runtime_checkable
 
-from .constants import OPERATOR_MAPPING
+from .constants import OPERATOR, OPERATOR_MAPPING
 from .nodes import (
     Collection, Field, GlobalScope, Infix, Item, Object, Prefix, Value, Postfix,
 )
@@ -16,6 +17,29 @@ class Context(Protocol):
         ...
 
 
+@functools.lru_cache(maxsize=256)
+def _is_context_type(data_type: type) -> bool:
+    """Check once per type whether its instances implement Context protocol."""
+    return callable(getattr(data_type, "get", None))
+
+
+def is_context(data: Any) -> bool:
+    """
+    Check whether data implements Context protocol.
+
+    The check by type is cached; instances providing 'get' dynamically
+    (e.g. through __getattr__ or mocks) are checked on the instance itself.
+    """
+    return _is_context_type(type(data)) or callable(getattr(data, "get", None))
+
+
+def bool_result(result: Any) -> bool:
+    """Return the result of evaluation, which must be a bool."""
+    if not isinstance(result, bool):
+        raise TypeError(f"The result {result!r} is not a bool")
+    return result
+
+
 class EvaluateVisitor:
     """Visitor that evaluates specification expressions."""
 
@@ -63,18 +87,25 @@ class EvaluateVisitor:
         items = self._context.get(node.name())
         self._pop()
 
-        if not isinstance(items, list):
+        if not isinstance(items, (tuple, list)):
             raise TypeError("Value is not a collection of Contexts")
 
-        result = False
-        for item in items:
+        predicate = node.predicate()
+        outer_item = self._current_item
+
+        def matches(item: Context) -> bool:
             if not isinstance(item, Context):
                 raise TypeError("Collection item is not a Context")
             self._current_item = item
-            node.predicate().accept(self)
-            if not isinstance(self.current_value(), bool):
+            predicate.accept(self)
+            value = self.current_value()
+            if not isinstance(value, bool):
                 raise TypeError("Predicate did not yield a boolean")
-            result = result or self.current_value()
+            return value
+
+        # any() stops at the first matching item
+        result = any(map(matches, items))
+        self._current_item = outer_item
 
         self.set_current_value(result)
 
@@ -106,9 +137,14 @@ class EvaluateVisitor:
         node.left().accept(self)
         left = self.current_value()
 
+        # A boolean left operand may decide AND/OR alone, the right one is not evaluated then
+        operator = node.operator()
+        if left is False and operator == OPERATOR.AND or left is True and operator == OPERATOR.OR:
+            return
+
         node.right().accept(self)
         right = self.current_value()
-        self.set_current_value(self._OPERATOR_MAPPING[node.operator()](left, right))
+        self.set_current_value(self._OPERATOR_MAPPING[operator](left, right))
 
     def visit_postfix(self, node: Postfix) -> None:
         """Visit postfix operator node."""
@@ -118,20 +154,30 @@ class EvaluateVisitor:
 
     def result(self) -> bool:
         """Get final boolean result of evaluation."""
-        result = self.current_value()
-        if not isinstance(result, bool):
-            raise TypeError("The result %r is not a bool", (result,))
-        return result
+        return bool_result(self.current_value())
 
 
 class CollectionContext:
     """Context for collections that can be queried with wildcards."""
 
-    def __init__(self, items: list[Context]):
-        self._items = items
+    def __init__(self, items: Iterable[Context]):
+        # Frozen, so the collection can't change while it is being filtered
+        self._items = tuple(items)
 
     def get(self, slice_: str) -> Any:
         """Get collection slice."""
         if slice_ == "*":
             return self._items
         raise ValueError(f'Unsupported slice type "{slice_}"')
+
+    def __len__(self) -> int:
+        """
+        Return number of items.
+
+        Like the tuple it wraps, an empty collection is falsy.
+        """
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> Context:
+        """Get item by index, negative indexes count from the end."""
+        return self._items[index]
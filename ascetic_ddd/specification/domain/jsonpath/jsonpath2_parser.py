@@ -5,6 +5,7 @@ Parses JSONPath expressions with C-style placeholders (%s, %d, %f, %(name)s)
 and converts them to Specification AST nodes using jsonpath2 library.
 """
 from typing import Any, Dict, Tuple, Union
+import functools
 import re
 
 from jsonpath2.path import Path
@@ -35,6 +36,7 @@ from ..nodes import (
     GlobalScope,
     GreaterThan,
     GreaterThanEqual,
+    Infix,
     Item,
     LessThan,
     LessThanEqual,
@@ -46,7 +48,56 @@ from ..nodes import (
     Visitable,
     Wildcard,
 )
-from ..evaluate_visitor import EvaluateVisitor
+from ..constants import OPERATOR, OPERATOR_MAPPING
+from ..evaluate_visitor import EvaluateVisitor, bool_result, is_context
+
+
+# String literals first, so operators inside them are skipped as part of the literal;
+# ! is replaced only when it is not the start of !=
+_RE_OPERATORS = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|==|&&|\|\||!(?=[^=])')
+
+_OPERATOR_REPLACEMENTS = {
+    "==": "=",
+    "&&": " and ",
+    "||": " or ",
+    "!": "not ",
+}
+
+
+def _replace_operator(match: re.Match) -> str:
+    token = match.group()
+    return _OPERATOR_REPLACEMENTS.get(token, token)
+
+
+# Comparisons that may take the single-field fast path
+_COMPARISON_OPERATORS = frozenset((
+    OPERATOR.EQ, OPERATOR.NE, OPERATOR.GT, OPERATOR.LT, OPERATOR.GTE, OPERATOR.LTE,
+))
+
+# Stands in for the placeholder value while the filter shape is inspected
+_PROBE = object()
+
+
+def _lookup_param(ph: dict, params: Union[Tuple[Any, ...], Dict[str, Any]]) -> Any:
+    """Get the value bound to a placeholder from params."""
+    try:
+        return params[ph["key"]]
+    except (LookupError, TypeError):
+        if ph["positional"]:
+            raise ValueError(
+                f"Missing positional parameter at index {ph['key']}"
+            ) from None
+        raise ValueError(f"Missing named parameter: {ph['name']}") from None
+
+
+class _PlaceholderBinding:
+    """Per-call state of binding parameter values to placeholders in order."""
+
+    __slots__ = ("params", "index")
+
+    def __init__(self, params: Union[Tuple[Any, ...], Dict[str, Any]]):
+        self.params = params
+        self.index = 0
 
 
 class PlaceholderReference:
@@ -90,111 +141,37 @@ class ParametrizedSpecificationJsonPath2:
         self.template = template
         self._placeholder_info = []
         self._placeholder_refs = []
-        self._placeholder_bind_index = 0
-        self._in_item_context = False
 
         # Extract placeholders before parsing
         self._extract_placeholders()
 
-    def _normalize_equality_operator(self, template: str) -> str:
+        # Everything derived from the template is built here; match() only reads it,
+        # so one instance can be shared between threads
+        self._path = Path.parse_str(self._preprocess_template())
+        self._single_field = self._compile_single_field()
+        # Without placeholders params are not used, so the AST is built only once
+        self._constant_spec_ast = (
+            None if self._placeholder_info
+            else self._extract_filter_expression(self._path, ())
+        )
+
+    def _normalize_operators(self, template: str) -> str:
         """
-        Normalize == to = for jsonpath2 library compatibility.
+        Normalize RFC 9535 operators to jsonpath2 syntax in a single pass.
 
-        RFC 9535 standard defines == for equality, but jsonpath2 library
-        deviates from the standard and uses single =.
+        RFC 9535 standard defines == for equality and &&, ||, ! as logical
+        operators, but jsonpath2 library deviates from the standard and uses
+        single = and text operators and, or, not.
         This method provides better UX by accepting both syntaxes.
+        String literals are matched as a whole and kept unchanged.
 
         Args:
             template: JSONPath template string
 
         Returns:
-            Normalized template with == replaced by =
-        """
-        # Simple approach: replace == with = outside of string literals
-        # We need to be careful not to replace == inside strings like "value=="
-
-        result = []
-        i = 0
-        in_string = False
-        string_char = None
-
-        while i < len(template):
-            char = template[i]
-
-            # Track if we're inside a string literal
-            if char in ('"', "'") and (i == 0 or template[i-1] != '\\'):
-                if not in_string:
-                    in_string = True
-                    string_char = char
-                elif char == string_char:
-                    in_string = False
-                    string_char = None
-
-            # Replace == with = only outside strings
-            if not in_string and char == '=' and i + 1 < len(template) and template[i + 1] == '=':
-                result.append('=')
-                i += 2  # Skip both = characters
-                continue
-
-            result.append(char)
-            i += 1
-
-        return ''.join(result)
-
-    def _normalize_logical_operators(self, template: str) -> str:
+            Normalized template
         """
-        Normalize RFC 9535 logical operators to jsonpath2 text operators.
-
-        RFC 9535 standard defines: &&, ||, !
-        jsonpath2 library uses text operators: and, or, not
-        This method normalizes symbol operators to text operators.
-
-        Args:
-            template: JSONPath template string
-
-        Returns:
-            Normalized template with text logical operators
-        """
-        result = []
-        i = 0
-        in_string = False
-        string_char = None
-
-        while i < len(template):
-            char = template[i]
-
-            # Track if we're inside a string literal
-            if char in ('"', "'") and (i == 0 or template[i-1] != '\\'):
-                if not in_string:
-                    in_string = True
-                    string_char = char
-                elif char == string_char:
-                    in_string = False
-                    string_char = None
-
-            if not in_string:
-                # Replace && with and
-                if char == '&' and i + 1 < len(template) and template[i + 1] == '&':
-                    result.append(' and ')
-                    i += 2
-                    continue
-
-                # Replace || with or
-                elif char == '|' and i + 1 < len(template) and template[i + 1] == '|':
-                    result.append(' or ')
-                    i += 2
-                    continue
-
-                # Replace ! with not (but not in !=)
-                elif char == '!' and i + 1 < len(template) and template[i + 1] != '=':
-                    result.append('not ')
-                    i += 1
-                    continue
-
-            result.append(char)
-            i += 1
-
-        return ''.join(result)
+        return _RE_OPERATORS.sub(_replace_operator, template)
 
     def _extract_placeholders(self):
         """Extract placeholder information from template."""
@@ -208,6 +185,8 @@ class ParametrizedSpecificationJsonPath2:
                     "name": name,
                     "format_type": format_type,
                     "positional": False,
+                    # Key into params, resolved once at parse time
+                    "key": name,
                 }
             )
 
@@ -223,6 +202,7 @@ class ParametrizedSpecificationJsonPath2:
                     "name": str(position),
                     "format_type": format_type,
                     "positional": True,
+                    "key": position,
                 }
             )
             position += 1
@@ -298,15 +278,9 @@ class ParametrizedSpecificationJsonPath2:
         # Add parentheses to filter expressions (required by jsonpath2)
         processed = self._add_parentheses_to_filter(processed)
 
-        # Normalize == to = for jsonpath2 library compatibility
-        # RFC 9535 standard defines ==, but jsonpath2 library uses single =
-        # We replace == with = to provide better UX and compatibility with the library
-        processed = self._normalize_equality_operator(processed)
-
-        # Normalize logical operators for jsonpath2 library compatibility
-        # RFC 9535 standard defines &&, ||, !, but jsonpath2 library uses and, or, not
-        # We replace symbol operators with text operators
-        processed = self._normalize_logical_operators(processed)
+        # Normalize ==, &&, ||, ! for jsonpath2 library compatibility
+        # RFC 9535 standard defines them, but jsonpath2 library uses =, and, or, not
+        processed = self._normalize_operators(processed)
 
         # Replace named placeholders
         named_pattern = r"%\((\w+)\)([sdf])"
@@ -367,9 +341,7 @@ class ParametrizedSpecificationJsonPath2:
         Returns:
             Specification AST node
         """
-        # Reset placeholder binding index
-        self._placeholder_bind_index = 0
-        self._placeholder_refs = []
+        binding = _PlaceholderBinding(params)
 
         # Check for wildcard
         has_wildcard = self._contains_wildcard(path)
@@ -389,11 +361,11 @@ class ParametrizedSpecificationJsonPath2:
                         # Found filter expression
                         if has_wildcard and collection_name:
                             return self._create_wildcard_spec(
-                                subscript.expression, collection_name, params
+                                subscript.expression, collection_name, binding
                             )
                         else:
                             return self._convert_expression_to_spec(
-                                subscript.expression, params, False
+                                subscript.expression, binding, False
                             )
 
             current_node = getattr(current_node, "next_node", None)
@@ -401,7 +373,7 @@ class ParametrizedSpecificationJsonPath2:
         raise ValueError("No filter expression found in JSONPath")
 
     def _create_wildcard_spec(
-        self, expression, collection_name: str, params
+        self, expression, collection_name: str, binding: _PlaceholderBinding
     ) -> Wildcard:
         """
         Create a Wildcard specification for collection filtering.
@@ -409,39 +381,37 @@ class ParametrizedSpecificationJsonPath2:
         Args:
             expression: Filter expression
             collection_name: Name of the collection field
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
 
         Returns:
             Wildcard specification node
         """
         # Convert filter with Item context
-        predicate = self._convert_expression_to_spec(expression, params, True)
+        predicate = self._convert_expression_to_spec(expression, binding, True)
 
         # Create Wildcard node
         parent = Object(GlobalScope(), collection_name)
         return Wildcard(parent, predicate)
 
     def _convert_expression_to_spec(
-        self, expression, params, in_item_context: bool
+        self, expression, binding: _PlaceholderBinding, in_item_context: bool
     ) -> Visitable:
         """
         Convert jsonpath2 expression to Specification AST.
 
         Args:
             expression: JSONPath expression node
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
             in_item_context: Whether we're in a wildcard/item context
 
         Returns:
             Specification AST node
         """
-        self._in_item_context = in_item_context
-
         # Handle unary NOT operator
         if isinstance(expression, NotUnaryOperatorExpression):
             # Get the operand expression
             operand = self._convert_expression_to_spec(
-                expression.expression, params, in_item_context
+                expression.expression, binding, in_item_context
             )
             return Not(operand)
 
@@ -450,7 +420,7 @@ class ParametrizedSpecificationJsonPath2:
             # Get all operands
             operands = []
             for operand in expression.expressions:
-                operands.append(self._convert_expression_to_spec(operand, params, in_item_context))
+                operands.append(self._convert_expression_to_spec(operand, binding, in_item_context))
 
             # Combine with AND or OR
             if isinstance(expression, AndVariadicOperatorExpression):
@@ -466,13 +436,17 @@ class ParametrizedSpecificationJsonPath2:
 
         # Handle SomeExpression (nested wildcards)
         if isinstance(expression, SomeExpression):
-            return self._convert_some_expression(expression, params, in_item_context)
+            return self._convert_some_expression(expression, binding, in_item_context)
 
         # Handle binary operators
         if isinstance(expression, BinaryOperatorExpression):
             # Get left and right operands
-            left = self._convert_node_or_value(expression.left_node_or_value, params)
-            right = self._convert_node_or_value(expression.right_node_or_value, params)
+            left = self._convert_node_or_value(
+                expression.left_node_or_value, binding, in_item_context
+            )
+            right = self._convert_node_or_value(
+                expression.right_node_or_value, binding, in_item_context
+            )
 
             # Map expression type to Specification node
             if isinstance(expression, EqualBinaryOperatorExpression):
@@ -493,7 +467,7 @@ class ParametrizedSpecificationJsonPath2:
         raise ValueError(f"Unsupported expression type: {type(expression)}")
 
     def _convert_some_expression(
-        self, expression: SomeExpression, params, in_item_context: bool
+        self, expression: SomeExpression, binding: _PlaceholderBinding, in_item_context: bool
     ) -> Wildcard:
         """
         Convert SomeExpression (nested wildcard) to Wildcard Specification node.
@@ -511,7 +485,7 @@ class ParametrizedSpecificationJsonPath2:
 
         Args:
             expression: SomeExpression from jsonpath2
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
             in_item_context: Whether we're in a wildcard/item context
 
         Returns:
@@ -558,7 +532,7 @@ class ParametrizedSpecificationJsonPath2:
 
         # Convert filter expression to predicate
         # We're now in item context because we're inside a wildcard
-        predicate = self._convert_expression_to_spec(filter_expression, params, True)
+        predicate = self._convert_expression_to_spec(filter_expression, binding, True)
 
         # Build parent: Item() or GlobalScope() + Object(collection_name)
         parent = Item() if in_item_context else GlobalScope()
@@ -567,13 +541,16 @@ class ParametrizedSpecificationJsonPath2:
         # Create Wildcard node
         return Wildcard(parent, predicate)
 
-    def _convert_node_or_value(self, node_or_value, params) -> Visitable:
+    def _convert_node_or_value(
+        self, node_or_value, binding: _PlaceholderBinding, in_item_context: bool
+    ) -> Visitable:
         """
         Convert jsonpath2 node or value to Specification AST.
 
         Args:
             node_or_value: JSONPath node or literal value
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
+            in_item_context: Whether we're in a wildcard/item context
 
         Returns:
             Specification AST node
@@ -581,8 +558,8 @@ class ParametrizedSpecificationJsonPath2:
         # Check if it's a literal value
         if isinstance(node_or_value, (int, float, str, bool, type(None))):
             # Check if it's a placeholder marker
-            if self._placeholder_bind_index < len(self._placeholder_info):
-                ph = self._placeholder_info[self._placeholder_bind_index]
+            if binding.index < len(self._placeholder_info):
+                ph = self._placeholder_info[binding.index]
 
                 # Check if this is a placeholder marker
                 is_placeholder = False
@@ -593,21 +570,9 @@ class ParametrizedSpecificationJsonPath2:
 
                 if is_placeholder:
                     # Get actual value from params
-                    if ph["positional"]:
-                        param_idx = int(ph["name"])
-                        if param_idx < len(params):
-                            actual_value = params[param_idx]
-                        else:
-                            raise ValueError(
-                                f"Missing positional parameter at index {param_idx}"
-                            )
-                    else:
-                        if ph["name"] in params:
-                            actual_value = params[ph["name"]]
-                        else:
-                            raise ValueError(f"Missing named parameter: {ph['name']}")
+                    actual_value = _lookup_param(ph, binding.params)
 
-                    self._placeholder_bind_index += 1
+                    binding.index += 1
                     return Value(actual_value)
 
             return Value(node_or_value)
@@ -636,7 +601,7 @@ class ParametrizedSpecificationJsonPath2:
             if field_chain:
                 # Build nested Field structure for nested paths
                 # e.g., ["profile", "age"] -> Field(Object(parent, "profile"), "age")
-                parent = Item() if self._in_item_context else GlobalScope()
+                parent = Item() if in_item_context else GlobalScope()
 
                 # Build Object chain for all fields except the last
                 for field in field_chain[:-1]:
@@ -648,10 +613,37 @@ class ParametrizedSpecificationJsonPath2:
 
         # Check for nested expression
         if isinstance(node_or_value, (BinaryOperatorExpression, AndVariadicOperatorExpression, OrVariadicOperatorExpression, NotUnaryOperatorExpression)):
-            return self._convert_expression_to_spec(node_or_value, params, self._in_item_context)
+            return self._convert_expression_to_spec(node_or_value, binding, in_item_context)
 
         raise ValueError(f"Unsupported node type: {type(node_or_value)}")
 
+    def _compile_single_field(self):
+        """
+        Recognize a filter that compares one top-level field with the only placeholder.
+
+        Returns:
+            Tuple of (field name, comparison function, placeholder info)
+            or None if the filter has another shape
+        """
+        if len(self._placeholder_info) != 1:
+            return None
+
+        ph = self._placeholder_info[0]
+        probe_params = (_PROBE,) if ph["positional"] else {ph["key"]: _PROBE}
+        spec_ast = self._extract_filter_expression(self._path, probe_params)
+
+        if not isinstance(spec_ast, Infix) or spec_ast.operator() not in _COMPARISON_OPERATORS:
+            return None
+        left, right = spec_ast.left(), spec_ast.right()
+        if not (
+            type(left) is Field
+            and type(left.object()) is GlobalScope
+            and type(right) is Value
+            and right.value() is _PROBE
+        ):
+            return None
+        return left.name(), OPERATOR_MAPPING[spec_ast.operator()], ph
+
     def match(
         self, data: Any, params: Union[Tuple[Any, ...], Dict[str, Any]] = ()
     ) -> bool:
@@ -672,23 +664,22 @@ class ParametrizedSpecificationJsonPath2:
             True
         """
         # Check if data implements Context protocol (has 'get' method)
-        if not hasattr(data, "get") or not callable(getattr(data, "get")):
+        if not is_context(data):
             raise TypeError(
                 f"Data must implement Context protocol (have a 'get' method), "
                 f"got {type(data).__name__}"
             )
 
-        # Reset placeholder binding index
-        self._placeholder_bind_index = 0
-
-        # Preprocess template
-        processed_template = self._preprocess_template()
-
-        # Parse with jsonpath2
-        path = Path.parse_str(processed_template)
+        # Single comparison of a field with a placeholder is evaluated directly
+        if self._single_field is not None:
+            field_name, compare, ph = self._single_field
+            value = _lookup_param(ph, params)
+            return bool_result(compare(data.get(field_name), value))
 
         # Extract filter expression and convert to Specification AST
-        spec_ast = self._extract_filter_expression(path, params)
+        spec_ast = self._constant_spec_ast
+        if spec_ast is None:
+            spec_ast = self._extract_filter_expression(self._path, params)
 
         # Evaluate using EvaluateVisitor
         visitor = EvaluateVisitor(data)
@@ -697,10 +688,13 @@ class ParametrizedSpecificationJsonPath2:
         return visitor.result()
 
 
+@functools.lru_cache(maxsize=512)
 def parse(template: str) -> ParametrizedSpecificationJsonPath2:
     """
     Parse JSONPath expression with C-style placeholders (jsonpath2 implementation).
 
+    The same template returns the same specification, so it is parsed only once.
+
     Args:
         template: JSONPath with %s, %d, %f or %(name)s placeholders
 
@@ -10,16 +10,21 @@ RFC 9535 Compliance:
 - Uses || for logical OR (double pipe)
 - Uses ! for logical NOT (exclamation mark)
 """
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import functools
 import re
+import sys
 
+from ..constants import OPERATOR, OPERATOR_MAPPING
 from ..nodes import (
     And,
+    Collection,
     Equal,
     Field,
     GlobalScope,
     GreaterThan,
     GreaterThanEqual,
+    Infix,
     Item,
     LessThan,
     LessThanEqual,
@@ -27,16 +32,44 @@ from ..nodes import (
     NotEqual,
     Object,
     Or,
+    Postfix,
+    Prefix,
     Value,
     Visitable,
     Wildcard,
 )
-from ..evaluate_visitor import Context, EvaluateVisitor
+from ..evaluate_visitor import Context, bool_result, is_context
+
+
+# Matches the name of a named placeholder token: %(name)s
+_RE_NAMED_PLACEHOLDER = re.compile(r"%\((\w+)\)[sdf]")
+
+
+class _Placeholder:
+    """Placeholder marker stored in a Value node until match() binds it."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Union[int, str]):
+        # Key into params: position for %s, name for %(name)s
+        self.key = key
+
+    def __repr__(self):
+        return f"_Placeholder({self.key!r})"
+
+
+def _missing_param(marker: _Placeholder) -> ValueError:
+    """Build the error raised when params has no value for a placeholder."""
+    if type(marker.key) is int:
+        return ValueError(f"Missing positional parameter at index {marker.key}")
+    return ValueError(f"Missing named parameter: {marker.key}")
 
 
 class Token:
     """Represents a token in the JSONPath expression."""
 
+    __slots__ = ("type", "value", "position")
+
     def __init__(self, type_: str, value: Any, position: int = 0):
         self.type = type_
         self.value = value
@@ -75,6 +108,12 @@ class Lexer:
         ("WHITESPACE", r"\s+"),
     ]
 
+    # All patterns as one alternation, tried in the same order;
+    # the name of the matching group is the token type
+    TOKEN_REGEX = re.compile(
+        "|".join(f"(?P<{token_type}>{pattern})" for token_type, pattern in TOKEN_PATTERNS)
+    )
+
     def __init__(self, text: str):
         self.text = text
         self.position = 0
@@ -82,30 +121,198 @@ class Lexer:
 
     def tokenize(self) -> list[Token]:
         """Tokenize the input text."""
+        text_match = self.TOKEN_REGEX.match
         while self.position < len(self.text):
-            matched = False
-
-            for token_type, pattern in self.TOKEN_PATTERNS:
-                regex = re.compile(pattern)
-                match = regex.match(self.text, self.position)
-
-                if match:
-                    value = match.group(0)
-                    if token_type != "WHITESPACE":  # Skip whitespace
-                        self.tokens.append(Token(token_type, value, self.position))
-                    self.position = match.end()
-                    matched = True
-                    break
+            match = text_match(self.text, self.position)
 
-            if not matched:
+            if match is None:
                 raise SyntaxError(
                     f"Unexpected character at position {self.position}: "
                     f"{self.text[self.position]}"
                 )
 
+            token_type = match.lastgroup
+            if token_type != "WHITESPACE":  # Skip whitespace
+                value = match.group()
+                if token_type == "IDENTIFIER":
+                    # Field names become context keys, interned they compare by identity
+                    value = sys.intern(value)
+                self.tokens.append(Token(token_type, value, self.position))
+            self.position = match.end()
+
         return self.tokens
 
 
+Params = Union[Tuple[Any, ...], Dict[str, Any]]
+
+# Compiled node: (root context, current collection item, params) -> value
+CompiledNode = Callable[[Context, Optional[Context], Params], Any]
+
+
+class _CompileVisitor:
+    """
+    Visitor that compiles a specification AST into nested closures.
+
+    The AST is walked once at parse time; the closures evaluate it the same
+    way EvaluateVisitor does, with placeholders bound from params on each call.
+    """
+
+    _OPERATOR_MAPPING = OPERATOR_MAPPING
+
+    def __init__(self):
+        self._compiled: CompiledNode | None = None
+
+    def compile(self, node: Visitable) -> CompiledNode:
+        """Compile node and return its closure."""
+        node.accept(self)
+        return self._compiled
+
+    def visit_global_scope(self, node: GlobalScope) -> None:
+        """Compile global scope node."""
+        def global_scope(root, item, params):
+            return root
+
+        self._compiled = global_scope
+
+    def visit_object(self, node: Object) -> None:
+        """Compile object node navigation."""
+        # A chain of objects (e.g. @.a.b.c) is flattened into one closure walking its names
+        names = []
+        while isinstance(node, Object):
+            names.append(node.name())
+            node = node.parent()
+        names = tuple(reversed(names))
+        parent = self.compile(node)
+
+        def obj(root, item, params):
+            value = parent(root, item, params)
+            for name in names:
+                value = value.get(name)
+                if not is_context(value):
+                    raise TypeError(f"Object {name} is not a Context")
+            return value
+
+        self._compiled = obj
+
+    def visit_collection(self, node: Collection) -> None:
+        """Compile collection node, true if any item matches the predicate."""
+        parent = self.compile(node.parent())
+        name = node.name()
+        predicate = self.compile(node.predicate())
+
+        def collection(root, item, params):
+            items = parent(root, item, params).get(name)
+            if not isinstance(items, (tuple, list)):
+                raise TypeError("Value is not a collection of Contexts")
+
+            def matches(current: Context) -> bool:
+                if not is_context(current):
+                    raise TypeError("Collection item is not a Context")
+                value = predicate(root, current, params)
+                if not isinstance(value, bool):
+                    raise TypeError("Predicate did not yield a boolean")
+                return value
+
+            # any() stops at the first matching item
+            return any(map(matches, items))
+
+        self._compiled = collection
+
+    def visit_item(self, node: Item) -> None:
+        """Compile item node (current collection item)."""
+        def current_item(root, item, params):
+            if item is None:
+                raise RuntimeError("No current item in context")
+            return item
+
+        self._compiled = current_item
+
+    def visit_field(self, node: Field) -> None:
+        """Compile field node retrieving its value."""
+        obj = self.compile(node.object())
+        name = node.name()
+
+        def field(root, item, params):
+            return obj(root, item, params).get(name)
+
+        self._compiled = field
+
+    def visit_value(self, node: Value) -> None:
+        """Compile value node, binding placeholders from params."""
+        value = node.value()
+
+        if type(value) is _Placeholder:
+            key = value.key
+
+            def placeholder(root, item, params):
+                try:
+                    return params[key]
+                except (LookupError, TypeError):
+                    raise _missing_param(value) from None
+
+            self._compiled = placeholder
+        else:
+            def constant(root, item, params):
+                return value
+
+            self._compiled = constant
+
+    def visit_prefix(self, node: Prefix) -> None:
+        """Compile prefix operator node."""
+        self._compiled = self._compile_unary(node)
+
+    def visit_postfix(self, node: Postfix) -> None:
+        """Compile postfix operator node."""
+        self._compiled = self._compile_unary(node)
+
+    def _compile_unary(self, node: Union[Prefix, Postfix]) -> CompiledNode:
+        operand = self.compile(node.operand())
+        func = self._OPERATOR_MAPPING[node.operator()]
+
+        def unary(root, item, params):
+            return func(operand(root, item, params))
+
+        return unary
+
+    def visit_infix(self, node: Infix) -> None:
+        """Compile infix operator node."""
+        left = self.compile(node.left())
+        right = self.compile(node.right())
+        node_operator = node.operator()
+        func = self._OPERATOR_MAPPING[node_operator]
+
+        if node_operator == OPERATOR.AND or node_operator == OPERATOR.OR:
+            # A boolean left operand may decide AND/OR alone, the right one is not evaluated then
+            decisive = node_operator == OPERATOR.OR
+
+            def logical(root, item, params):
+                left_value = left(root, item, params)
+                if left_value is decisive:
+                    return left_value
+                return func(left_value, right(root, item, params))
+
+            self._compiled = logical
+        elif isinstance(node.right(), Value) and type(node.right().value()) is _Placeholder:
+            # Comparison with a placeholder (@.age > %d), the common case:
+            # params are indexed inline instead of calling the placeholder closure
+            marker = node.right().value()
+            key = marker.key
+
+            def compare_param(root, item, params):
+                try:
+                    right_value = params[key]
+                except (LookupError, TypeError):
+                    raise _missing_param(marker) from None
+                return func(left(root, item, params), right_value)
+
+            self._compiled = compare_param
+        else:
+            def infix(root, item, params):
+                return func(left(root, item, params), right(root, item, params))
+
+            self._compiled = infix
+
+
 class NativeParametrizedSpecification:
     """
     Native JSONPath specification parser without external dependencies.
@@ -129,6 +336,14 @@ class NativeParametrizedSpecification:
         # Extract placeholders before tokenization
         self._extract_placeholders()
 
+        # Tokenize and parse once; match() only binds values into this AST,
+        # so the specification is not mutated after construction
+        tokens = Lexer(self.template).tokenize()
+        self._spec_ast, self._is_wildcard = self._parse_path(tokens)
+
+        # Evaluation is compiled once as well, match() calls the closure
+        self._compiled = _CompileVisitor().compile(self._spec_ast)
+
     def _extract_placeholders(self):
         """Extract placeholder information from template."""
         # Find named placeholders: %(name)s, %(age)d, %(price)f
@@ -141,6 +356,8 @@ class NativeParametrizedSpecification:
                     "name": name,
                     "format_type": format_type,
                     "positional": False,
+                    # Key into params, resolved once at parse time
+                    "key": name,
                 }
             )
 
@@ -156,6 +373,7 @@ class NativeParametrizedSpecification:
                     "name": str(position),
                     "format_type": format_type,
                     "positional": True,
+                    "key": position,
                 }
             )
             position += 1
@@ -457,8 +675,11 @@ class NativeParametrizedSpecification:
         Returns:
             Value node with placeholder marker
         """
-        # We'll store a special marker that we'll replace during match()
-        value = Value(("__PLACEHOLDER__", self._placeholder_bind_index))
+        # The params key is resolved here, so match() only has to index params
+        match = _RE_NAMED_PLACEHOLDER.fullmatch(placeholder_str)
+        if match is not None:
+            return Value(_Placeholder(sys.intern(match.group(1))))
+        value = Value(_Placeholder(self._placeholder_bind_index))
         self._placeholder_bind_index += 1
         return value
 
@@ -550,83 +771,7 @@ class NativeParametrizedSpecification:
 
         raise SyntaxError("Expected filter expression")
 
-    def _bind_placeholder(
-        self, value: Any, params: Union[Tuple[Any, ...], Dict[str, Any]]
-    ) -> Any:
-        """
-        Bind a placeholder to its actual value.
-
-        Args:
-            value: Value (may contain placeholder marker)
-            params: Parameter values
-
-        Returns:
-            Actual value
-        """
-        if isinstance(value, tuple) and len(value) == 2:
-            marker, idx = value
-            if marker == "__PLACEHOLDER__":
-                if idx < len(self._placeholder_info):
-                    ph_info = self._placeholder_info[idx]
-
-                    # Get actual value from params
-                    if ph_info["positional"]:
-                        param_idx = int(ph_info["name"])
-                        if param_idx < len(params):
-                            return params[param_idx]
-                    else:
-                        if ph_info["name"] in params:
-                            return params[ph_info["name"]]
-
-                    # If not found, return marker as-is
-                    return value
-
-        return value
-
-    def _bind_values_in_ast(
-        self, node: Visitable, params: Union[Tuple[Any, ...], Dict[str, Any]]
-    ) -> Visitable:
-        """
-        Recursively bind placeholder values in the AST.
-
-        Args:
-            node: AST node
-            params: Parameter values
-
-        Returns:
-            AST node with bound values
-        """
-        if isinstance(node, Value):
-            # Bind the value if it's a placeholder
-            bound_value = self._bind_placeholder(node.value(), params)
-            return Value(bound_value)
-
-        elif isinstance(node, (Equal, NotEqual, GreaterThan, LessThan, GreaterThanEqual, LessThanEqual)):
-            # Recursively bind left and right
-            left = self._bind_values_in_ast(node.left(), params)
-            right = self._bind_values_in_ast(node.right(), params)
-            return type(node)(left, right)
-
-        elif isinstance(node, (And, Or)):
-            left = self._bind_values_in_ast(node.left(), params)
-            right = self._bind_values_in_ast(node.right(), params)
-            return type(node)(left, right)
-
-        elif isinstance(node, Not):
-            operand = self._bind_values_in_ast(node.operand(), params)
-            return Not(operand)
-
-        elif isinstance(node, Wildcard):
-            # Recursively bind predicate
-            predicate = self._bind_values_in_ast(node.predicate(), params)
-            return Wildcard(node.parent(), predicate)
-
-        # For other nodes (Field, Item, GlobalScope, Object), return as-is
-        return node
-
-    def match(
-        self, data: Any, params: Union[Tuple[Any, ...], Dict[str, Any]] = ()
-    ) -> bool:
+    def match(self, data: Any, params: Params = ()) -> bool:
         """
         Check if data matches the specification with given parameters.
 
@@ -644,32 +789,16 @@ class NativeParametrizedSpecification:
             True
         """
         # Check if data implements Context protocol (has 'get' method)
-        if not hasattr(data, "get") or not callable(getattr(data, "get")):
+        if not is_context(data):
             raise TypeError(
                 f"Data must implement Context protocol (have a 'get' method), "
                 f"got {type(data).__name__}"
             )
 
-        # Reset placeholder binding index
-        self._placeholder_bind_index = 0
-
-        # Tokenize
-        lexer = Lexer(self.template)
-        tokens = lexer.tokenize()
-
-        # Parse to AST
-        spec_ast, is_wildcard = self._parse_path(tokens)
-
-        # Bind placeholder values
-        bound_ast = self._bind_values_in_ast(spec_ast, params)
-
-        # Evaluate using EvaluateVisitor
-        visitor = EvaluateVisitor(data)
-        bound_ast.accept(visitor)
-
-        return visitor.result()
+        return bool_result(self._compiled(data, None, params))
 
 
+@functools.lru_cache(maxsize=512)
 def parse(template: str) -> NativeParametrizedSpecification:
     """
     Parse RFC 9535 compliant JSONPath expression with C-style placeholders (native implementation).
@@ -678,7 +807,8 @@ def parse(template: str) -> NativeParametrizedSpecification:
         template: JSONPath with %s, %d, %f or %(name)s placeholders
 
     Returns:
-        NativeParametrizedSpecification that can be executed with different parameter values
+        NativeParametrizedSpecification that can be executed with different parameter values.
+        The same template string returns the same (immutable) specification.
 
     Examples:
         >>> spec = parse("$[?@.age > %d]")
@@ -5,6 +5,7 @@ Parses RFC 9535 compliant JSONPath expressions with C-style placeholders
 (%s, %d, %f, %(name)s) and converts them to Specification AST nodes.
 """
 from typing import Any, Dict, Tuple, Union
+import functools
 import re
 
 from jsonpath_rfc9535 import JSONPathEnvironment
@@ -42,6 +43,16 @@ from ..nodes import (
 from ..evaluate_visitor import EvaluateVisitor
 
 
+class _PlaceholderBinding:
+    """Per-call state of binding parameter values to placeholders in order."""
+
+    __slots__ = ("params", "index")
+
+    def __init__(self, params: Union[Tuple[Any, ...], Dict[str, Any]]):
+        self.params = params
+        self.index = 0
+
+
 class ParametrizedSpecificationRFC9535:
     """
     JSONPath specification parser using jsonpath-rfc9535 library (RFC 9535 compliant).
@@ -58,13 +69,15 @@ class ParametrizedSpecificationRFC9535:
         """
         self.template = template
         self._placeholder_info = []
-        self._placeholder_bind_index = 0
-        self._in_item_context = False
         self.env = JSONPathEnvironment()
 
         # Extract placeholders before parsing
         self._extract_placeholders()
 
+        # The query is compiled here and match() only reads it,
+        # so one instance can be shared between threads
+        self._query = self.env.compile(self._preprocess_template())
+
     def _extract_placeholders(self):
         """Extract placeholder information from template."""
         # Find named placeholders: %(name)s, %(age)d, %(price)f
@@ -160,8 +173,7 @@ class ParametrizedSpecificationRFC9535:
         Returns:
             Specification AST node
         """
-        # Reset placeholder binding index
-        self._placeholder_bind_index = 0
+        binding = _PlaceholderBinding(params)
 
         # Check for wildcard
         has_wildcard = self._contains_wildcard(query)
@@ -179,17 +191,17 @@ class ParametrizedSpecificationRFC9535:
                     filter_expr = selector.expression.expression
                     if has_wildcard and collection_name:
                         return self._create_wildcard_spec(
-                            filter_expr, collection_name, params
+                            filter_expr, collection_name, binding
                         )
                     else:
                         return self._convert_expression_to_spec(
-                            filter_expr, params, False
+                            filter_expr, binding, False
                         )
 
         raise ValueError("No filter expression found in JSONPath")
 
     def _create_wildcard_spec(
-        self, expression, collection_name: str, params
+        self, expression, collection_name: str, binding: _PlaceholderBinding
     ) -> Wildcard:
         """
         Create a Wildcard specification for collection filtering.
@@ -197,20 +209,20 @@ class ParametrizedSpecificationRFC9535:
         Args:
             expression: Filter expression
             collection_name: Name of the collection field
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
 
         Returns:
             Wildcard specification node
         """
         # Convert filter with Item context
-        predicate = self._convert_expression_to_spec(expression, params, True)
+        predicate = self._convert_expression_to_spec(expression, binding, True)
 
         # Create Wildcard node
         parent = Object(GlobalScope(), collection_name)
         return Wildcard(parent, predicate)
 
     def _convert_relative_query_to_wildcard(
-        self, rel_query: RelativeFilterQuery, params, in_item_context: bool
+        self, rel_query: RelativeFilterQuery, binding: _PlaceholderBinding, in_item_context: bool
     ) -> Wildcard:
         """
         Convert RelativeFilterQuery to nested Wildcard.
@@ -220,7 +232,7 @@ class ParametrizedSpecificationRFC9535:
 
         Args:
             rel_query: RelativeFilterQuery from jsonpath-rfc9535
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
             in_item_context: Whether we're already in a wildcard context
 
         Returns:
@@ -259,7 +271,7 @@ class ParametrizedSpecificationRFC9535:
         # Convert the filter expression (if any)
         if filter_expression:
             # Set item context to True for nested wildcard predicate
-            predicate = self._convert_expression_to_spec(filter_expression, params, True)
+            predicate = self._convert_expression_to_spec(filter_expression, binding, True)
         else:
             # No filter - matches all items (this is unusual but possible)
             # We could use AlwaysTrue specification if we had one
@@ -268,27 +280,25 @@ class ParametrizedSpecificationRFC9535:
         return Wildcard(collection_obj, predicate)
 
     def _convert_expression_to_spec(
-        self, expression, params, in_item_context: bool
+        self, expression, binding: _PlaceholderBinding, in_item_context: bool
     ) -> Visitable:
         """
         Convert jsonpath-rfc9535 expression to Specification AST.
 
         Args:
             expression: JSONPath expression node
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
             in_item_context: Whether we're in a wildcard/item context
 
         Returns:
             Specification AST node
         """
-        self._in_item_context = in_item_context
-
         # Handle unary NOT operator (prefix expression)
         if isinstance(expression, PrefixExpression):
             if expression.operator == '!':
                 # Get the operand expression
                 operand = self._convert_expression_to_spec(
-                    expression.right, params, in_item_context
+                    expression.right, binding, in_item_context
                 )
                 return Not(operand)
             else:
@@ -298,10 +308,10 @@ class ParametrizedSpecificationRFC9535:
         if isinstance(expression, LogicalExpression):
             # Get left and right operands
             left = self._convert_expression_to_spec(
-                expression.left, params, in_item_context
+                expression.left, binding, in_item_context
             )
             right = self._convert_expression_to_spec(
-                expression.right, params, in_item_context
+                expression.right, binding, in_item_context
             )
 
             # Determine operator type
@@ -317,8 +327,8 @@ class ParametrizedSpecificationRFC9535:
         # Handle comparison operators
         if isinstance(expression, ComparisonExpression):
             # Get left and right operands
-            left = self._convert_operand_to_spec(expression.left, params)
-            right = self._convert_operand_to_spec(expression.right, params)
+            left = self._convert_operand_to_spec(expression.left, binding, in_item_context)
+            right = self._convert_operand_to_spec(expression.right, binding, in_item_context)
 
             # Map operator to Specification node
             if expression.operator == '==':
@@ -338,17 +348,20 @@ class ParametrizedSpecificationRFC9535:
 
         # Handle nested wildcard (RelativeFilterQuery as expression)
         if isinstance(expression, RelativeFilterQuery):
-            return self._convert_relative_query_to_wildcard(expression, params, in_item_context)
+            return self._convert_relative_query_to_wildcard(expression, binding, in_item_context)
 
         raise ValueError(f"Unsupported expression type: {type(expression)}")
 
-    def _convert_operand_to_spec(self, operand, params) -> Visitable:
+    def _convert_operand_to_spec(
+        self, operand, binding: _PlaceholderBinding, in_item_context: bool
+    ) -> Visitable:
         """
         Convert jsonpath-rfc9535 operand to Specification AST.
 
         Args:
             operand: JSONPath operand (literal or query)
-            params: Parameter values
+            binding: Parameter values and placeholder binding position
+            in_item_context: Whether we're in a wildcard/item context
 
         Returns:
             Specification AST node
@@ -357,28 +370,28 @@ class ParametrizedSpecificationRFC9535:
         if isinstance(operand, IntegerLiteral):
             value = operand.value
             # Check if it's a placeholder marker
-            if value == 999999 and self._placeholder_bind_index < len(self._placeholder_info):
-                ph = self._placeholder_info[self._placeholder_bind_index]
+            if value == 999999 and binding.index < len(self._placeholder_info):
+                ph = self._placeholder_info[binding.index]
                 if ph["format_type"] in ("d", "f"):
-                    return self._get_placeholder_value(ph, params)
+                    return self._get_placeholder_value(ph, binding)
             return Value(value)
 
         elif isinstance(operand, FloatLiteral):
             value = operand.value
             # Check if it's a placeholder marker
-            if value == 999999.0 and self._placeholder_bind_index < len(self._placeholder_info):
-                ph = self._placeholder_info[self._placeholder_bind_index]
+            if value == 999999.0 and binding.index < len(self._placeholder_info):
+                ph = self._placeholder_info[binding.index]
                 if ph["format_type"] == "f":
-                    return self._get_placeholder_value(ph, params)
+                    return self._get_placeholder_value(ph, binding)
             return Value(value)
 
         elif isinstance(operand, StringLiteral):
             value = operand.value
             # Check if it's a placeholder marker
-            if value == "__PLACEHOLDER__" and self._placeholder_bind_index < len(self._placeholder_info):
-                ph = self._placeholder_info[self._placeholder_bind_index]
+            if value == "__PLACEHOLDER__" and binding.index < len(self._placeholder_info):
+                ph = self._placeholder_info[binding.index]
                 if ph["format_type"] == "s":
-                    return self._get_placeholder_value(ph, params)
+                    return self._get_placeholder_value(ph, binding)
             return Value(value)
 
         elif isinstance(operand, BooleanLiteral):
@@ -404,7 +417,7 @@ class ParametrizedSpecificationRFC9535:
 
             # If it has wildcard or filter, treat it as a nested wildcard
             if has_wildcard or has_filter:
-                return self._convert_relative_query_to_wildcard(operand, params, self._in_item_context)
+                return self._convert_relative_query_to_wildcard(operand, binding, in_item_context)
 
             # Field access (simple or nested): @.field or @.profile.age
             if query.segments and len(query.segments) > 0:
@@ -423,7 +436,7 @@ class ParametrizedSpecificationRFC9535:
 
                 # Build nested Field structure for nested paths
                 # e.g., ["profile", "age"] -> Field(Object(parent, "profile"), "age")
-                parent = Item() if self._in_item_context else GlobalScope()
+                parent = Item() if in_item_context else GlobalScope()
 
                 # Build Object chain for all fields except the last
                 for field in field_chain[:-1]:
@@ -437,12 +450,13 @@ class ParametrizedSpecificationRFC9535:
 
         # Handle nested expressions
         if isinstance(operand, (ComparisonExpression, LogicalExpression, PrefixExpression)):
-            return self._convert_expression_to_spec(operand, params, self._in_item_context)
+            return self._convert_expression_to_spec(operand, binding, in_item_context)
 
         raise ValueError(f"Unsupported operand type: {type(operand)}")
 
-    def _get_placeholder_value(self, ph, params) -> Value:
+    def _get_placeholder_value(self, ph, binding: _PlaceholderBinding) -> Value:
         """Get actual value from parameters for a placeholder."""
+        params = binding.params
         if ph["positional"]:
             param_idx = int(ph["name"])
             if param_idx < len(params):
@@ -457,7 +471,7 @@ class ParametrizedSpecificationRFC9535:
             else:
                 raise ValueError(f"Missing named parameter: {ph['name']}")
 
-        self._placeholder_bind_index += 1
+        binding.index += 1
         return Value(actual_value)
 
     def match(
@@ -486,17 +500,8 @@ class ParametrizedSpecificationRFC9535:
                 f"got {type(data).__name__}"
             )
 
-        # Reset placeholder binding index
-        self._placeholder_bind_index = 0
-
-        # Preprocess template
-        processed_template = self._preprocess_template()
-
-        # Parse with jsonpath-rfc9535
-        query = self.env.compile(processed_template)
-
         # Extract filter expression and convert to Specification AST
-        spec_ast = self._extract_filter_expression(query, params)
+        spec_ast = self._extract_filter_expression(self._query, params)
 
         # Evaluate using EvaluateVisitor
         visitor = EvaluateVisitor(data)
@@ -505,10 +510,13 @@ class ParametrizedSpecificationRFC9535:
         return visitor.result()
 
 
+@functools.lru_cache(maxsize=512)
 def parse(template: str) -> ParametrizedSpecificationRFC9535:
     """
     Parse RFC 9535 compliant JSONPath expression with C-style placeholders.
 
+    The same template returns the same specification, so it is parsed only once.
+
     Args:
         template: JSONPath with %s, %d, %f or %(name)s placeholders
 
@@ -1,10 +1,16 @@
 """Unit tests for native JSONPath parser (without external dependencies)."""
 import unittest
 from typing import Any
+from unittest.mock import Mock
 
 from ...jsonpath.jsonpath_native_parser import Lexer
+from ...jsonpath.jsonpath_native_parser import _Placeholder
 from ...jsonpath.jsonpath_native_parser import parse
 from ...evaluate_visitor import CollectionContext
+from ...evaluate_visitor import EvaluateVisitor
+
+
+_MISSING = object()
 
 
 class DictContext:
@@ -15,9 +21,10 @@ class DictContext:
 
     def get(self, key: str) -> Any:
         """Get value by key."""
-        if key not in self._data:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Key '{key}' not found")
-        return self._data[key]
+        return value
 
 
 class NestedDictContext:
@@ -25,17 +32,21 @@ class NestedDictContext:
 
     def __init__(self, data: dict[str, Any]):
         self._data = data
+        self._wrappers: dict[str, NestedDictContext] = {}
 
     def get(self, key: str) -> Any:
         """Get value by key, supporting nested dict access."""
-        if key not in self._data:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Key '{key}' not found")
 
-        value = self._data[key]
-
-        # If value is a dict, wrap it in NestedDictContext
+        # If value is a dict, wrap it in NestedDictContext once per key,
+        # a key rebound to another dict gets a new wrapper
         if isinstance(value, dict):
-            return NestedDictContext(value)
+            wrapper = self._wrappers.get(key)
+            if wrapper is None or wrapper._data is not value:
+                wrapper = self._wrappers[key] = NestedDictContext(value)
+            return wrapper
 
         return value
 
@@ -43,55 +54,41 @@ class NestedDictContext:
 class TestNativeParser(unittest.TestCase):
     """Test native JSONPath parser."""
 
-    def test_simple_comparison_greater_than(self):
-        """Test simple greater-than comparison."""
-        spec = parse("$[?(@.age > %d)]")
-        user = DictContext({"age": 30})
-
-        self.assertTrue(spec.match(user, (25,)))
-        self.assertFalse(spec.match(user, (35,)))
-
-    def test_simple_comparison_less_than(self):
-        """Test simple less-than comparison."""
-        spec = parse("$[?(@.age < %d)]")
-        user = DictContext({"age": 25})
-
-        self.assertTrue(spec.match(user, (30,)))
-        self.assertFalse(spec.match(user, (20,)))
-
-    def test_simple_comparison_equal(self):
-        """Test simple equality comparison (RFC 9535: ==)."""
-        spec = parse("$[?@.name == %s]")
-        user = DictContext({"name": "Alice"})
-
-        self.assertTrue(spec.match(user, ("Alice",)))
-        self.assertFalse(spec.match(user, ("Bob",)))
-
-    def test_simple_comparison_not_equal(self):
-        """Test simple not-equal comparison."""
-        spec = parse("$[?@.status != %s]")
-        user = DictContext({"status": "active"})
-
-        self.assertTrue(spec.match(user, ("inactive",)))
-        self.assertFalse(spec.match(user, ("active",)))
-
-    def test_greater_than_or_equal(self):
-        """Test greater-than-or-equal comparison."""
-        spec = parse("$[?(@.age >= %d)]")
-        user = DictContext({"age": 30})
-
-        self.assertTrue(spec.match(user, (30,)))  # Equal
-        self.assertTrue(spec.match(user, (25,)))  # Greater
-        self.assertFalse(spec.match(user, (35,)))  # Less
-
-    def test_less_than_or_equal(self):
-        """Test less-than-or-equal comparison."""
-        spec = parse("$[?(@.age <= %d)]")
-        user = DictContext({"age": 30})
-
-        self.assertTrue(spec.match(user, (30,)))  # Equal
-        self.assertTrue(spec.match(user, (35,)))  # Less
-        self.assertFalse(spec.match(user, (25,)))  # Greater
+    @classmethod
+    def setUpClass(cls):
+        # Templates shared by several tests of the class
+        cls.spec_age_gt = parse("$[?(@.age > %d)]")
+
+        # Contexts are only read by match(), so the stores are shared as well
+        cls.store_scores = DictContext({"items": CollectionContext((
+            DictContext({"name": "Alice", "score": 90}),
+            DictContext({"name": "Bob", "score": 75}),
+            DictContext({"name": "Charlie", "score": 85}),
+        ))})
+        cls.store_users = DictContext({"users": CollectionContext((
+            DictContext({"name": "Alice", "age": 30, "role": "admin"}),
+            DictContext({"name": "Bob", "age": 25, "role": "user"}),
+        ))})
+
+    COMPARISON_CASES = (
+        ("$[?(@.age > %d)]", {"age": 30}, (((25,), True), ((35,), False))),
+        ("$[?(@.age < %d)]", {"age": 25}, (((30,), True), ((20,), False))),
+        # RFC 9535: ==
+        ("$[?@.name == %s]", {"name": "Alice"}, ((("Alice",), True), (("Bob",), False))),
+        ("$[?@.status != %s]", {"status": "active"}, ((("inactive",), True), (("active",), False))),
+        # Equal, greater, less
+        ("$[?(@.age >= %d)]", {"age": 30}, (((30,), True), ((25,), True), ((35,), False))),
+        ("$[?(@.age <= %d)]", {"age": 30}, (((30,), True), ((35,), True), ((25,), False))),
+    )
+
+    def test_comparison_operators(self):
+        """Test simple comparisons with each operator."""
+        for template, data, cases in self.COMPARISON_CASES:
+            spec = parse(template)
+            obj = DictContext(data)
+            for params, expected in cases:
+                with self.subTest(template=template, params=params):
+                    self.assertIs(spec.match(obj, params), expected)
 
     def test_named_placeholder(self):
         """Test named placeholder."""
@@ -119,7 +116,7 @@ class TestNativeParser(unittest.TestCase):
 
     def test_reuse_specification(self):
         """Test reusing specification with different parameters."""
-        spec = parse("$[?(@.age > %d)]")
+        spec = self.spec_age_gt
         user = DictContext({"age": 30})
 
         # Multiple calls with different parameters
@@ -127,17 +124,20 @@ class TestNativeParser(unittest.TestCase):
         self.assertFalse(spec.match(user, (35,)))
         self.assertTrue(spec.match(user, (20,)))
 
+    def test_parse_is_cached(self):
+        """Test that the same template is parsed only once."""
+        spec = self.spec_age_gt
+        user = DictContext({"age": 30})
+
+        self.assertIs(parse("$[?(@.age > %d)]"), spec)
+        self.assertTrue(spec.match(user, (25,)))
+        self.assertFalse(parse("$[?(@.age > %d)]").match(user, (35,)))
+
     def test_wildcard_collection(self):
         """Test wildcard collection filtering."""
 
         spec = parse("$.items[*][?(@.score > %d)]")
-
-        item1 = DictContext({"name": "Alice", "score": 90})
-        item2 = DictContext({"name": "Bob", "score": 75})
-        item3 = DictContext({"name": "Charlie", "score": 85})
-
-        collection = CollectionContext([item1, item2, item3])
-        root = DictContext({"items": collection})
+        root = self.store_scores
 
         # At least one item has score > 80
         self.assertTrue(spec.match(root, (80,)))
@@ -149,12 +149,7 @@ class TestNativeParser(unittest.TestCase):
         """Test wildcard with named placeholder."""
 
         spec = parse("$.users[*][?(@.age >= %(min_age)d)]")
-
-        user1 = DictContext({"name": "Alice", "age": 30})
-        user2 = DictContext({"name": "Bob", "age": 25})
-
-        collection = CollectionContext([user1, user2])
-        root = DictContext({"users": collection})
+        root = self.store_users
 
         self.assertTrue(spec.match(root, {"min_age": 28}))
         self.assertFalse(spec.match(root, {"min_age": 35}))
@@ -163,19 +158,14 @@ class TestNativeParser(unittest.TestCase):
         """Test wildcard with string comparison."""
 
         spec = parse("$.users[*][?@.role == %s]")
-
-        user1 = DictContext({"name": "Alice", "role": "admin"})
-        user2 = DictContext({"name": "Bob", "role": "user"})
-
-        collection = CollectionContext([user1, user2])
-        root = DictContext({"users": collection})
+        root = self.store_users
 
         self.assertTrue(spec.match(root, ("admin",)))
         self.assertFalse(spec.match(root, ("guest",)))
 
     def test_error_on_non_context_data(self):
         """Test error when data doesn't implement Context protocol."""
-        spec = parse("$[?(@.age > %d)]")
+        spec = self.spec_age_gt
 
         class NoGetMethod:
             def __init__(self):
@@ -186,14 +176,63 @@ class TestNativeParser(unittest.TestCase):
         with self.assertRaises(TypeError):
             spec.match(invalid_data, (25,))
 
+    def test_plain_dict_context(self):
+        """Test that a plain dict is accepted as context."""
+        spec = self.spec_age_gt
+
+        self.assertTrue(spec.match({"age": 30}, (25,)))
+        self.assertFalse(spec.match({"age": 30}, (35,)))
+
+    def test_dynamic_context_data(self):
+        """Test contexts providing 'get' only on the instance, like proxies and mocks."""
+
+        class Proxy:
+            def __init__(self, target):
+                self._target = target
+
+            def __getattr__(self, name):
+                return getattr(self._target, name)
+
+        context = Mock()
+        context.get.return_value = 30
+        user = Proxy(DictContext({"age": 30, "profile": Proxy(DictContext({"age": 30}))}))
+        store = DictContext({"users": CollectionContext([user])})
+
+        self.assertIs(self.spec_age_gt.match(context, (25,)), True)
+        self.assertIs(self.spec_age_gt.match(user, (25,)), True)
+        self.assertIs(parse("$[?(@.profile.age > %d)]").match(user, (25,)), True)
+        self.assertIs(parse("$.users[*][?(@.age > %d)]").match(store, (25,)), True)
+
     def test_error_on_missing_field(self):
         """Test error when field doesn't exist."""
-        spec = parse("$[?(@.age > %d)]")
+        spec = self.spec_age_gt
         user = DictContext({"name": "Alice"})  # No age field
 
         with self.assertRaises(KeyError):
             spec.match(user, (25,))
 
+    def test_error_on_missing_parameter(self):
+        """Test error when params has no value for a placeholder."""
+        user = DictContext({"age": 30, "name": "Alice"})
+
+        cases = (
+            ("$[?(@.age > %d)]", (), "Missing positional parameter at index 0"),
+            ("$[?(@.age > %(min_age)d)]", {}, "Missing named parameter: min_age"),
+            ("$[?(@.age > %(min_age)d)]", (25,), "Missing named parameter: min_age"),
+        )
+        for template, params, message in cases:
+            with self.subTest(template=template, params=params):
+                with self.assertRaisesRegex(ValueError, message):
+                    parse(template).match(user, params)
+
+    def test_error_on_non_collection_wildcard(self):
+        """Test error when wildcard is applied to a non-collection value."""
+        spec = parse("$.items[*][?(@.score > %d)]")
+        root = DictContext({"items": DictContext({"*": 90})})
+
+        with self.assertRaises(TypeError):
+            spec.match(root, (80,))
+
     def test_logical_and_operator(self):
         """Test logical AND operator (RFC 9535: &&)."""
         spec = parse("$[?@.age > %d && @.active == %s]")
@@ -298,23 +337,38 @@ class TestLexer(unittest.TestCase):
 class TestNativeParserNestedWildcards(unittest.TestCase):
     """Test nested wildcard functionality in native parser."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Templates shared by several tests of the class
+        cls.spec_price_gt = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+
+        # Contexts are only read by match(), so the stores are shared as well
+        cls.store_two_categories = DictContext({"categories": CollectionContext((
+            DictContext({"name": "Electronics", "items": CollectionContext((
+                DictContext({"name": "Laptop", "price": 999.0}),
+                DictContext({"name": "Mouse", "price": 29.0}),
+            ))}),
+            DictContext({"name": "Clothing", "items": CollectionContext((
+                DictContext({"name": "Shirt", "price": 49.0}),
+                DictContext({"name": "Jeans", "price": 89.0}),
+            ))}),
+        ))})
+        cls.store_empty = DictContext({"categories": CollectionContext((
+            DictContext({"name": "Empty", "items": CollectionContext(())}),
+        ))})
+        cls.store_both_match = DictContext({"categories": CollectionContext((
+            DictContext({"name": "Electronics", "items": CollectionContext((
+                DictContext({"name": "Laptop", "price": 999.0}),
+            ))}),
+            DictContext({"name": "Clothing", "items": CollectionContext((
+                DictContext({"name": "Designer Jeans", "price": 299.0}),
+            ))}),
+        ))})
+
     def test_nested_wildcard_simple(self):
         """Test nested wildcard with simple filter."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
-
-        # Create nested data structure
-        item1 = DictContext({"name": "Laptop", "price": 999.0})
-        item2 = DictContext({"name": "Mouse", "price": 29.0})
-        items1 = CollectionContext([item1, item2])
-        category1 = DictContext({"name": "Electronics", "items": items1})
-
-        item3 = DictContext({"name": "Shirt", "price": 49.0})
-        item4 = DictContext({"name": "Jeans", "price": 89.0})
-        items2 = CollectionContext([item3, item4])
-        category2 = DictContext({"name": "Clothing", "items": items2})
-
-        categories = CollectionContext([category1, category2])
-        store = DictContext({"categories": categories})
+        spec = self.spec_price_gt
+        store = self.store_two_categories
 
         # Should match: category1 has laptop with price > 500
         self.assertTrue(spec.match(store, (500.0,)))
@@ -325,15 +379,7 @@ class TestNativeParserNestedWildcards(unittest.TestCase):
     def test_nested_wildcard_with_logical_operators(self):
         """Test nested wildcard with AND operator."""
         spec = parse("$.categories[*][?@.items[*][?@.price > %f && @.price < %f]]")
-
-        # Create test data
-        item1 = DictContext({"name": "Laptop", "price": 999.0})
-        item2 = DictContext({"name": "Mouse", "price": 29.0})
-        items1 = CollectionContext([item1, item2])
-        category1 = DictContext({"name": "Electronics", "items": items1})
-
-        categories = CollectionContext([category1])
-        store = DictContext({"categories": categories})
+        store = self.store_two_categories
 
         # Should match: laptop price is between 500 and 1000
         self.assertTrue(spec.match(store, (500.0, 1000.0)))
@@ -343,34 +389,20 @@ class TestNativeParserNestedWildcards(unittest.TestCase):
 
     def test_nested_wildcard_empty_collection(self):
         """Test nested wildcard with empty inner collection."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+        spec = self.spec_price_gt
 
         # Category with no items
-        items = CollectionContext([])
-        category = DictContext({"name": "Empty", "items": items})
-
-        categories = CollectionContext([category])
-        store = DictContext({"categories": categories})
+        store = self.store_empty
 
         # Should not match: no items at all
         self.assertFalse(spec.match(store, (100.0,)))
 
     def test_nested_wildcard_multiple_matches(self):
         """Test nested wildcard where multiple categories match."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
-
-        # Category 1 with expensive items
-        item1 = DictContext({"name": "Laptop", "price": 999.0})
-        items1 = CollectionContext([item1])
-        category1 = DictContext({"name": "Electronics", "items": items1})
+        spec = self.spec_price_gt
 
-        # Category 2 with expensive items
-        item2 = DictContext({"name": "Designer Jeans", "price": 299.0})
-        items2 = CollectionContext([item2])
-        category2 = DictContext({"name": "Clothing", "items": items2})
-
-        categories = CollectionContext([category1, category2])
-        store = DictContext({"categories": categories})
+        # Both categories have expensive items
+        store = self.store_both_match
 
         # Should match: both categories have items > 200
         self.assertTrue(spec.match(store, (200.0,)))
@@ -378,14 +410,7 @@ class TestNativeParserNestedWildcards(unittest.TestCase):
     def test_nested_wildcard_with_named_placeholder(self):
         """Test nested wildcard with named placeholder."""
         spec = parse("$.categories[*][?@.items[*][?@.price > %(min_price)f]]")
-
-        # Create test data
-        item1 = DictContext({"name": "Laptop", "price": 999.0})
-        items = CollectionContext([item1])
-        category = DictContext({"name": "Electronics", "items": items})
-
-        categories = CollectionContext([category])
-        store = DictContext({"categories": categories})
+        store = self.store_two_categories
 
         # Should match with named parameter
         self.assertTrue(spec.match(store, {"min_price": 500.0}))
@@ -402,7 +427,7 @@ class TestNativeParserNestedPaths(unittest.TestCase):
         # Create nested structure
         product1 = DictContext({"name": "Laptop", "price": 999.0})
         product2 = DictContext({"name": "Mouse", "price": 29.0})
-        products = CollectionContext([product1, product2])
+        products = CollectionContext((product1, product2))
 
         data = NestedDictContext({
             "store": {
@@ -423,7 +448,7 @@ class TestNativeParserNestedPaths(unittest.TestCase):
 
         member1 = DictContext({"name": "Alice", "age": 30})
         member2 = DictContext({"name": "Bob", "age": 25})
-        members = CollectionContext([member1, member2])
+        members = CollectionContext((member1, member2))
 
         data = NestedDictContext({
             "company": {
@@ -471,7 +496,7 @@ class TestNativeParserNestedPaths(unittest.TestCase):
         product1 = DictContext({"name": "Laptop", "price": 999.0, "stock": 5})
         product2 = DictContext({"name": "Mouse", "price": 29.0, "stock": 100})
         product3 = DictContext({"name": "Monitor", "price": 599.0, "stock": 10})
-        products = CollectionContext([product1, product2, product3])
+        products = CollectionContext((product1, product2, product3))
 
         data = NestedDictContext({
             "store": {
@@ -491,7 +516,7 @@ class TestNativeParserNestedPaths(unittest.TestCase):
 
         item1 = DictContext({"name": "Widget", "quantity": 5})
         item2 = DictContext({"name": "Gadget", "quantity": 50})
-        items = CollectionContext([item1, item2])
+        items = CollectionContext((item1, item2))
 
         data = NestedDictContext({
             "warehouse": {
@@ -530,5 +555,74 @@ class TestNativeParserNestedPaths(unittest.TestCase):
         self.assertFalse(spec.match(data, (10,)))
 
 
+class _BoundEvaluateVisitor(EvaluateVisitor):
+    """EvaluateVisitor reading placeholder values from params."""
+
+    def __init__(self, context: Any, params: Any):
+        super().__init__(context)
+        self._params = params
+
+    def visit_value(self, node) -> None:
+        value = node.value()
+        if isinstance(value, _Placeholder):
+            value = self._params[value.key]
+        self.set_current_value(value)
+
+
+class TestNativeParserMatchesEvaluateVisitor(unittest.TestCase):
+    """Compiled specifications must agree with EvaluateVisitor on the same AST."""
+
+    USER = DictContext({"name": "Alice", "age": 30, "active": True})
+    STORE = DictContext({
+        "name": "Main",
+        "items": CollectionContext((
+            DictContext({"name": "Laptop", "price": 1000, "stock": 0}),
+            DictContext({"name": "Mouse", "price": 25, "stock": 10}),
+        )),
+        "categories": CollectionContext((
+            DictContext({"name": "Empty", "items": CollectionContext(())}),
+            DictContext({"name": "Tools", "items": CollectionContext((
+                DictContext({"name": "Hammer", "price": 15}),
+            ))}),
+        )),
+    })
+    COMPANY = NestedDictContext({
+        "company": {"department": {"manager": {"level": 5}}},
+    })
+
+    CASES = (
+        ("$[?(@.age > %d)]", USER, ((25,), (30,), (35,))),
+        ("$[?(@.age >= %d)]", USER, ((30,), (31,))),
+        ("$[?(@.age < %d)]", USER, ((30,), (31,))),
+        ("$[?(@.age <= %d)]", USER, ((29,), (30,))),
+        ("$[?@.name == %s]", USER, (("Alice",), ("Bob",))),
+        ("$[?@.name != %s]", USER, (("Alice",), ("Bob",))),
+        ("$[?(@.age > %(min_age)d)]", USER, ({"min_age": 25}, {"min_age": 35})),
+        ("$[?(@.age > %d && @.name == %s)]", USER,
+         ((25, "Alice"), (25, "Bob"), (35, "Alice"))),
+        ("$[?(@.age > %d || @.name == %s)]", USER,
+         ((25, "Bob"), (35, "Alice"), (35, "Bob"))),
+        ("$[?(@.age > %d && @.active == true)]", USER, ((25,), (35,))),
+        ("$[?!(@.age > %d)]", USER, ((25,), (35,))),
+        ("$[?(@.age == 30)]", USER, ((),)),
+        ("$.items[*][?(@.price > %d)]", STORE, ((20,), (1000,))),
+        ("$.items[*][?(@.stock > %d && @.price < %d)]", STORE,
+         ((0, 100), (0, 10), (10, 100))),
+        ("$.items[*][?(@.price > %d)]", DictContext({"items": CollectionContext(())}),
+         ((0,),)),
+        ("$.categories[*][?@.items[*][?@.price > %d]]", STORE, ((10,), (20,))),
+        ("$[?@.company.department.manager.level > %d]", COMPANY, ((3,), (10,))),
+    )
+
+    def test_same_result_as_evaluate_visitor(self):
+        for template, data, params_cases in self.CASES:
+            spec = parse(template)
+            for params in params_cases:
+                with self.subTest(template=template, params=params):
+                    visitor = _BoundEvaluateVisitor(data, params)
+                    spec._spec_ast.accept(visitor)
+                    self.assertIs(spec.match(data, params), visitor.result())
+
+
 if __name__ == "__main__":
     unittest.main()
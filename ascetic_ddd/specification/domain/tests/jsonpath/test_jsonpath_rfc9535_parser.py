@@ -1,10 +1,15 @@
 """Unit tests for JSONPath parser using jsonpath-rfc9535 library (RFC 9535 compliant)."""
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ...jsonpath.jsonpath_rfc9535_parser import parse
 
 
+_MISSING = object()
+
+
 class DictContext:
     """Dictionary-based context for testing."""
 
@@ -13,9 +18,10 @@ class DictContext:
 
     def get(self, key: str) -> Any:
         """Get value by key."""
-        if key not in self._data:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Key '{key}' not found")
-        return self._data[key]
+        return value
 
 
 class CollectionContext:
@@ -36,17 +42,21 @@ class NestedDictContext:
 
     def __init__(self, data: dict[str, Any]):
         self._data = data
+        self._wrappers: dict[str, NestedDictContext] = {}
 
     def get(self, key: str) -> Any:
         """Get value by key, supporting nested dict access."""
-        if key not in self._data:
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
             raise KeyError(f"Key '{key}' not found")
 
-        value = self._data[key]
-
-        # If value is a dict, wrap it in NestedDictContext
+        # If value is a dict, wrap it in NestedDictContext once per key,
+        # a key rebound to another dict gets a new wrapper
         if isinstance(value, dict):
-            return NestedDictContext(value)
+            wrapper = self._wrappers.get(key)
+            if wrapper is None or wrapper._data is not value:
+                wrapper = self._wrappers[key] = NestedDictContext(value)
+            return wrapper
 
         return value
 
@@ -54,9 +64,17 @@ class NestedDictContext:
 class TestJsonPathRFC9535Parser(unittest.TestCase):
     """Test JSONPath parser using jsonpath-rfc9535 (RFC 9535 compliant)."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Templates shared by several tests of the class
+        cls.spec_age_gt = parse("$[?@.age > %d]")
+        cls.spec_age_gt_and_active = parse("$[?@.age > %d && @.active == %s]")
+        cls.spec_age_outside = parse("$[?@.age < %d || @.age > %d]")
+        cls.spec_not_active = parse("$[?!(@.active == %s)]")
+
     def test_simple_comparison_greater_than(self):
         """Test simple greater-than comparison."""
-        spec = parse("$[?@.age > %d]")
+        spec = self.spec_age_gt
         user = DictContext({"age": 30})
 
         self.assertTrue(spec.match(user, (25,)))
@@ -130,7 +148,7 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
 
     def test_reuse_specification(self):
         """Test reusing specification with different parameters."""
-        spec = parse("$[?@.age > %d]")
+        spec = self.spec_age_gt
 
         user1 = DictContext({"age": 30})
         user2 = DictContext({"age": 20})
@@ -146,9 +164,38 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
         self.assertFalse(spec.match(user2, (35,)))
         self.assertTrue(spec.match(user3, (35,)))
 
+    def test_parse_is_cached(self):
+        """Test that the same template is parsed only once."""
+        spec = self.spec_age_gt
+        user = DictContext({"age": 30})
+
+        self.assertIs(parse("$[?@.age > %d]"), spec)
+        self.assertTrue(spec.match(user, (25,)))
+        self.assertFalse(parse("$[?@.age > %d]").match(user, (35,)))
+
+    def test_shared_spec_is_thread_safe(self):
+        """Test that a cached specification gives the same results from many threads."""
+        spec = parse("$[?@.age > %d && @.age < %d]")
+        cases = [(age, (age - 1, age + 1) if age % 2 else (age + 1, age + 2)) for age in range(400)]
+
+        def run(case):
+            age, params = case
+            return spec.match(DictContext({"age": age}), params)
+
+        # Switch threads as often as possible to interleave the calls
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(run, cases))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(results, [age % 2 == 1 for age, _ in cases])
+
     def test_logical_and_operator(self):
         """Test logical AND operator (RFC 9535 uses &&)."""
-        spec = parse("$[?@.age > %d && @.active == %s]")
+        spec = self.spec_age_gt_and_active
         user = DictContext({"age": 30, "active": True})
 
         self.assertTrue(spec.match(user, (25, True)))
@@ -157,7 +204,7 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
 
     def test_logical_or_operator(self):
         """Test logical OR operator (RFC 9535 uses ||)."""
-        spec = parse("$[?@.age < %d || @.age > %d]")
+        spec = self.spec_age_outside
         user_young = DictContext({"age": 15})
         user_old = DictContext({"age": 70})
         user_middle = DictContext({"age": 40})
@@ -168,7 +215,7 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
 
     def test_logical_not_operator(self):
         """Test logical NOT operator (RFC 9535 uses !)."""
-        spec = parse("$[?!(@.active == %s)]")
+        spec = self.spec_not_active
         user_active = DictContext({"active": True})
         user_inactive = DictContext({"active": False})
 
@@ -235,14 +282,14 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
         """Test access to nested fields."""
         # Note: This test depends on DictContext supporting nested access
         # For simplicity, we test with flat structure
-        spec = parse("$[?@.age > %d]")
+        spec = self.spec_age_gt
         user = DictContext({"age": 30})
 
         self.assertTrue(spec.match(user, (25,)))
 
     def test_error_missing_positional_parameter(self):
         """Test error when positional parameter is missing."""
-        spec = parse("$[?@.age > %d && @.active == %s]")
+        spec = self.spec_age_gt_and_active
         user = DictContext({"age": 30, "active": True})
 
         with self.assertRaises(ValueError) as cm:
@@ -276,17 +323,17 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
         self.assertTrue(spec_eq.match(user, (30,)))
 
         # RFC 9535 uses && for AND
-        spec_and = parse("$[?@.age > %d && @.active == %s]")
+        spec_and = self.spec_age_gt_and_active
         user_active = DictContext({"age": 30, "active": True})
         self.assertTrue(spec_and.match(user_active, (25, True)))
 
         # RFC 9535 uses || for OR
-        spec_or = parse("$[?@.age < %d || @.age > %d]")
+        spec_or = self.spec_age_outside
         user_young = DictContext({"age": 15})
         self.assertTrue(spec_or.match(user_young, (18, 65)))
 
         # RFC 9535 uses ! for NOT
-        spec_not = parse("$[?!(@.active == %s)]")
+        spec_not = self.spec_not_active
         user_inactive = DictContext({"active": False})
         self.assertTrue(spec_not.match(user_inactive, (True,)))
 
@@ -294,6 +341,11 @@ class TestJsonPathRFC9535Parser(unittest.TestCase):
 class TestJsonPathRFC9535Wildcards(unittest.TestCase):
     """Test wildcard functionality with RFC 9535."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Templates shared by several tests of the class
+        cls.spec_price_gt = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+
     def test_wildcard_collection_filter(self):
         """Test filtering items in a collection with wildcard."""
         spec = parse("$.items[*][?@.price > %f]")
@@ -314,7 +366,7 @@ class TestJsonPathRFC9535Wildcards(unittest.TestCase):
 
     def test_nested_wildcard_simple(self):
         """Test nested wildcard with simple filter."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+        spec = self.spec_price_gt
 
         # Create nested data structure
         item1 = DictContext({"name": "Laptop", "price": 999.0})
@@ -357,7 +409,7 @@ class TestJsonPathRFC9535Wildcards(unittest.TestCase):
 
     def test_nested_wildcard_empty_collection(self):
         """Test nested wildcard with empty inner collection."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+        spec = self.spec_price_gt
 
         # Category with no items
         items = CollectionContext([])
@@ -371,7 +423,7 @@ class TestJsonPathRFC9535Wildcards(unittest.TestCase):
 
     def test_nested_wildcard_multiple_matches(self):
         """Test nested wildcard where multiple categories match."""
-        spec = parse("$.categories[*][?@.items[*][?@.price > %f]]")
+        spec = self.spec_price_gt
 
         # Category 1 with expensive items
         item1 = DictContext({"name": "Laptop", "price": 999.0})
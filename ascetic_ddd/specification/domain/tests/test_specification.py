@@ -15,6 +15,7 @@ from ..nodes import (
     Item,
     Not,
     Object,
+    Or,
     Value,
     Wildcard,
 )
@@ -154,6 +155,26 @@ class TestEvaluateVisitor(unittest.TestCase):
 
         self.assertEqual(visitor.result(), False)
 
+    def test_and_operator_short_circuit(self):
+        """Test that AND skips its right operand after a false left one."""
+        ctx = DictContext({})  # The field would raise KeyError if evaluated
+        visitor = EvaluateVisitor(ctx)
+
+        expression = And(Value(False), Field(GlobalScope(), "missing"))
+        expression.accept(visitor)
+
+        self.assertEqual(visitor.result(), False)
+
+    def test_or_operator_short_circuit(self):
+        """Test that OR skips its right operand after a true left one."""
+        ctx = DictContext({})  # The field would raise KeyError if evaluated
+        visitor = EvaluateVisitor(ctx)
+
+        expression = Or(Value(True), Field(GlobalScope(), "missing"))
+        expression.accept(visitor)
+
+        self.assertEqual(visitor.result(), True)
+
     def test_equal_operator(self):
         """Test equality operator."""
         ctx = DictContext({})
@@ -278,6 +299,73 @@ class TestEvaluateVisitor(unittest.TestCase):
         # Should be False because no items have score > 80
         self.assertEqual(visitor.result(), False)
 
+    def test_collection_is_frozen(self):
+        """Test that collection items are copied into a tuple."""
+        items = [DictContext({"score": ComparableInt(90)})]
+        collection_ctx = CollectionContext(item for item in items)
+        items.clear()
+        root_ctx = DictContext({"items": collection_ctx})
+
+        visitor = EvaluateVisitor(root_ctx)
+
+        # items[*].score > 80
+        items_obj = Object(GlobalScope(), "items")
+        predicate = GreaterThan(Field(Item(), "score"), Value(ComparableInt(80)))
+        Wildcard(items_obj, predicate).accept(visitor)
+
+        self.assertIsInstance(collection_ctx.get("*"), tuple)
+        self.assertEqual(visitor.result(), True)
+
+    def test_collection_sequence_access(self):
+        """Test collection length and access by index."""
+        item1 = DictContext({"name": "Alice"})
+        item2 = DictContext({"name": "Bob"})
+        collection_ctx = CollectionContext([item1, item2])
+
+        self.assertEqual(len(collection_ctx), 2)
+        self.assertIs(collection_ctx[0], item1)
+        self.assertIs(collection_ctx[-1], item2)
+        self.assertEqual(len(CollectionContext([])), 0)
+
+    def test_empty_collection_is_falsy(self):
+        """Test that a collection is truthy only when it has items."""
+        self.assertFalse(CollectionContext([]))
+        self.assertTrue(CollectionContext([DictContext({})]))
+
+    def test_collection_stops_at_first_match(self):
+        """Test that items after the first matching one are not evaluated."""
+        item1 = DictContext({"score": ComparableInt(90)})
+        item2 = DictContext({})  # Would raise KeyError if evaluated
+        root_ctx = DictContext({"items": CollectionContext([item1, item2])})
+
+        visitor = EvaluateVisitor(root_ctx)
+
+        # items[*].score > 80
+        predicate = GreaterThan(Field(Item(), "score"), Value(ComparableInt(80)))
+        Wildcard(Object(GlobalScope(), "items"), predicate).accept(visitor)
+
+        self.assertEqual(visitor.result(), True)
+
+    def test_nested_collection_restores_current_item(self):
+        """Test that the outer item is current again after a nested collection."""
+        category = DictContext({
+            "name": "Electronics",
+            "items": CollectionContext([DictContext({"name": "Laptop"})]),
+        })
+        root_ctx = DictContext({"categories": CollectionContext([category])})
+
+        visitor = EvaluateVisitor(root_ctx)
+
+        # categories[*][items[*].name = "Laptop" AND name = "Electronics"]
+        inner = Wildcard(
+            Object(Item(), "items"),
+            Equal(Field(Item(), "name"), Value("Laptop")),
+        )
+        predicate = And(inner, Equal(Field(Item(), "name"), Value("Electronics")))
+        Wildcard(Object(GlobalScope(), "categories"), predicate).accept(visitor)
+
+        self.assertEqual(visitor.result(), True)
+
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling in evaluation."""
@@ -292,6 +380,16 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(KeyError):
             field_node.accept(visitor)
 
+    def test_non_bool_result(self):
+        """Test error when the expression does not evaluate to a bool."""
+        ctx = DictContext({})
+        visitor = EvaluateVisitor(ctx)
+
+        Value(42).accept(visitor)
+
+        with self.assertRaisesRegex(TypeError, "The result 42 is not a bool"):
+            visitor.result()
+
     def test_type_error_in_comparison(self):
         """Test that type checking works for comparison operators."""
         ctx = DictContext({})